@@ -5,24 +5,151 @@ if version_info < (3, 12, 0):
                     " is required for PeterCLIEngine.")
 
 
-from cliengine import *
-from cliengine import __all__ as __cliengine_all__
-from color import *
-from color import __all__ as __color_all__
-from datatype import *
-from datatype import __all__ as __datatype_all__
-from models import *
-from models import __all__ as __profile_template_all__
-from profile_manage import *
-from profile_manage import __all__ as __profile_manage_all__
-from str_convert import *
-from str_convert import __all__ as __str_convert_all__
-from utils import *
-from utils import __all__ as __utils_all__
+from cliengine import (
+    bool_convert,
+    ArgType,
+    ARG_TYPES,
+    parse_argtype,
+    register_argtype,
+    replace_argtype,
+    Arg,
+    CommandPattern,
+    Command,
+    tokenize,
+    CLIEngine,
+)
+from color import (
+    FG,
+    BG,
+    STYLE,
+    is_color_supported,
+    colorize,
+    ColorTheme,
+    DEFAULT_THEME,
+    DARK_THEME,
+    LIGHT_THEME,
+)
+from datatype import (
+    Variable,
+    get_var,
+    DataType,
+    with_slots,
+)
+from models import (
+    ItemType,
+    Item,
+    Location,
+    NPC,
+    Achievement,
+    Event,
+    Quest,
+    SkillType,
+    PlayerProfile,
+    PROFILE_SAVE_VERSION,
+    GameContext,
+    GameLauncher,
+    DEFAULT_LAUNCHER_SETTINGS,
+)
+from profile_manage import (
+    init_working_folder,
+    init_settings,
+    read_json,
+    load_settings,
+    save_settings,
+    get_profiles,
+    load_profile,
+    save_profile,
+    save_profile_data,
+    delete_profile,
+    profile_exists,
+    generate_unique_profile_id,
+    migrate_save,
+    migrate_saves_in_folder,
+    export_profile,
+    import_profile,
+)
+from str_convert import (
+    to_snake_case,
+    to_camel_case,
+    to_pascal_case,
+    to_title_case,
+    to_kebab_case,
+)
+from utils import (
+    catch_interrupt,
+    catch_interrupt_with_api,
+    catch_interrupt_silent,
+    TypeLike,
+    istype,
+    read_line,
+    match_input,
+)
 
 
-__all__ = (
-    __cliengine_all__ + __color_all__ + __datatype_all__
-    + __profile_manage_all__ + __profile_template_all__
-    + __str_convert_all__ + __utils_all__
-)
+__all__ = [
+    "bool_convert",
+    "ArgType",
+    "ARG_TYPES",
+    "parse_argtype",
+    "register_argtype",
+    "replace_argtype",
+    "Arg",
+    "CommandPattern",
+    "Command",
+    "tokenize",
+    "CLIEngine",
+    "FG",
+    "BG",
+    "STYLE",
+    "is_color_supported",
+    "colorize",
+    "ColorTheme",
+    "DEFAULT_THEME",
+    "DARK_THEME",
+    "LIGHT_THEME",
+    "Variable",
+    "get_var",
+    "DataType",
+    "with_slots",
+    "ItemType",
+    "Item",
+    "Location",
+    "NPC",
+    "Achievement",
+    "Event",
+    "Quest",
+    "SkillType",
+    "PlayerProfile",
+    "PROFILE_SAVE_VERSION",
+    "GameContext",
+    "GameLauncher",
+    "DEFAULT_LAUNCHER_SETTINGS",
+    "init_working_folder",
+    "init_settings",
+    "read_json",
+    "load_settings",
+    "save_settings",
+    "get_profiles",
+    "load_profile",
+    "save_profile",
+    "save_profile_data",
+    "delete_profile",
+    "profile_exists",
+    "generate_unique_profile_id",
+    "migrate_save",
+    "migrate_saves_in_folder",
+    "export_profile",
+    "import_profile",
+    "to_snake_case",
+    "to_camel_case",
+    "to_pascal_case",
+    "to_title_case",
+    "to_kebab_case",
+    "catch_interrupt",
+    "catch_interrupt_with_api",
+    "catch_interrupt_silent",
+    "TypeLike",
+    "istype",
+    "read_line",
+    "match_input",
+]
@@ -1,6 +1,11 @@
-from re import Match, compile as re_compile, VERBOSE
+from functools import lru_cache, partial
+from inspect import Parameter, signature
+from re import DOTALL, compile as re_compile
+from sys import intern
 from typing import Any, Callable, cast
 
+from utils import read_line
+
 _readline: Any = None
 _READLINE_AVAILABLE: bool = False
 try:
@@ -22,20 +27,28 @@ __all__ = [
 ]
 
 
-TOKEN_REGEX = re_compile(
-    r"""
-    <(?P<reqname>[a-zA-Z_]\w*)(:(?P<reqtype>[a-zA-Z_]\w*))?>
-    |
-    \[(?P<optname>[a-zA-Z_]\w*)(:(?P<opttype>[a-zA-Z_]\w*))?\]
-    |
-    (?P<word>[^\s]+)
-    """,
-    VERBOSE,
-)
+# inner part of ``<name[:type]>`` and ``[name[:type]]`` pattern tokens
+_VAR_RE = re_compile(r"([A-Za-z_]\w*)(?::([A-Za-z_]\w*))?")
+
+# one input token: a run of quoted strings, escapes and plain characters
+_TOKEN_SCAN = re_compile(
+    r"""(?:"[^"\\]*(?:\\.[^"\\]*)*"?|'[^'\\]*(?:\\.[^'\\]*)*'?|\\.?|[^\s"'\\]+)+""",
+    DOTALL)
+# the quote-delimited strings and escapes within a token
+_QUOTED_SCAN = re_compile(
+    r"""\"([^"\\]*(?:\\.[^"\\]*)*)"?|'([^'\\]*(?:\\.[^'\\]*)*)'?|(\\.?)""",
+    DOTALL)
+_ESCAPE_REGEX = re_compile(r"\\(.?)", DOTALL)
+_unquote = partial(_QUOTED_SCAN.sub, r"\1\2\3")
+_unescape = partial(_ESCAPE_REGEX.sub, r"\1")
 
 TRUE_LITERALS = (r"1", r"true", r"yes", r"y", r"t")
 FALSE_LITERALS = (r"0", r"false", r"no", r"n", r"f")
 BOOL_LITERALS = TRUE_LITERALS + FALSE_LITERALS
+_BOOL_MAP: dict[str, bool] = {
+    **dict.fromkeys(TRUE_LITERALS, True),
+    **dict.fromkeys(FALSE_LITERALS, False),
+}
 
 
 def bool_convert(v: str, /) -> bool:
@@ -54,13 +67,13 @@ def bool_convert(v: str, /) -> bool:
     Raises:
         ValueError: If ``v`` does not match any known boolean literal.
     """
-    v = v.lower()
-    if v in TRUE_LITERALS:
-        return True
-    elif v in FALSE_LITERALS:
-        return False
-    else:
-        raise ValueError(f"Invalid boolean literal: {v}")
+    result = _BOOL_MAP.get(v)
+    if result is None:
+        v = v.lower()
+        result = _BOOL_MAP.get(v)
+        if result is None:
+            raise ValueError(f"Invalid boolean literal: {v}")
+    return result
 
 
 class ArgType:
@@ -71,9 +84,19 @@ class ArgType:
         pattern (re.Pattern): The compiled regex pattern used to validate values.
         converter (Callable[[str], Any]): A callable that converts a valid string
             value to the target Python type.
+        self_validating (bool): True if ``converter`` raises ``ValueError`` on
+            invalid values itself, so :meth:`convert` skips the regex check.
+        fast_validator (Callable[[str], bool] | None): A predicate equivalent
+            to the pattern, used in its place to validate values, or None.
+        cacheable (bool): True if converting a value always gives the same
+            result, so engines may reuse the lookups of repeated input.  Read
+            when a command using the type is registered.
     """
 
-    def __init__(self, name: str, pattern: str, converter: Callable[[str], Any]):
+    def __init__(self, name: str, pattern: str, converter: Callable[[str], Any],
+                 self_validating: bool = False,
+                 fast_validator: Callable[[str], bool] | None = None,
+                 cacheable: bool = False):
         """Initializes an ArgType with a name, regex pattern, and converter.
 
         Args:
@@ -81,10 +104,21 @@ class ArgType:
             pattern (str): A regex pattern string that valid values must fully match.
             converter (Callable[[str], Any]): A callable that parses a matched string
                 into the desired Python type.
+            self_validating (bool): Whether ``converter`` rejects invalid values
+                by raising ``ValueError``. Defaults to False.
+            fast_validator (Callable[[str], bool] | None): A cheaper predicate
+                that accepts exactly the values ``pattern`` matches. Defaults
+                to None, validating with the pattern.
+            cacheable (bool): Whether ``converter`` is pure, e.g. not looking
+                up mutable state such as the items in a room. Defaults to
+                False.
         """
         self.name = name
         self.pattern = re_compile(pattern)
         self.converter = converter
+        self.self_validating = self_validating
+        self.fast_validator = fast_validator
+        self.cacheable = cacheable
 
     def is_valid(self, value: str) -> bool:
         """Checks whether a string value matches this type's pattern.
@@ -95,25 +129,39 @@ class ArgType:
         Returns:
             bool: True if ``value`` fully matches the pattern, False otherwise.
         """
+        if self.fast_validator is not None:
+            return self.fast_validator(value)
         return bool(self.pattern.fullmatch(value))
 
     def convert(self, value: str) -> Any:
-        """Converts a string value to this type's target Python type.
+        """Validates and converts a string value to this type's target Python type.
 
         Args:
             value (str): The string to convert.
 
         Returns:
             Any: The converted value.
+
+        Raises:
+            ValueError: If ``value`` is not a valid value of this type.
         """
+        if not self.self_validating and not self.is_valid(value):
+            raise ValueError(f"Invalid {self.name} value: {value!r}")
         return self.converter(value)
 
 
 ARG_TYPES: dict[str, ArgType] = {
-    "int": ArgType("int", r"[+-]?\d+", int),
-    "num": ArgType("num", r"[+-]?(\d*\.?\d+|\d+\.?\d*)", float),
-    "bool": ArgType("bool", rf"(?i:{'|'.join(BOOL_LITERALS)})", bool_convert),
-    "str": ArgType("str", r".+", lambda x: x),
+    # int() and float() also take "1_000", " 5", "1e5" and "nan", so the
+    # patterns stay in charge of what counts as a number
+    "int": ArgType("int", r"[+-]?\d+", int, cacheable=True),
+    "num": ArgType("num", r"[+-]?(\d*\.?\d+|\d+\.?\d*)", float,
+                   cacheable=True),
+    "bool": ArgType("bool", rf"(?i:{'|'.join(BOOL_LITERALS)})", bool_convert,
+                    self_validating=True, cacheable=True),
+    # "." stops at newlines, which quoted tokens can contain
+    "str": ArgType("str", r".+", str,
+                   fast_validator=lambda v: v != "" and "\n" not in v,
+                   cacheable=True),
 }
 
 
@@ -121,7 +169,10 @@ def register_argtype(argtype: ArgType, /) -> None:
     """Register a custom :class:`ArgType` in the global ``ARG_TYPES`` registry.
 
     After registration the type is available by name in all command pattern
-    strings (e.g. ``"go <direction:compass>"``).
+    strings (e.g. ``"go <direction:compass>"``).  Engines only cache the
+    lookups of commands whose argument types are all
+    :attr:`ArgType.cacheable`, so a type converting against mutable state
+    should leave the flag off.
 
     Args:
         argtype: The :class:`ArgType` instance to register.
@@ -163,13 +214,11 @@ def parse_argtype(name: str, type_name: str | None, /) -> ArgType:
     Raises:
         ValueError: If ``type_name`` is not None and not found in ``ARG_TYPES``.
     """
-    if type_name is None:
-        return ARG_TYPES["str"]
-
-    if type_name not in ARG_TYPES:
+    argtype = ARG_TYPES.get(type_name or "str")
+    if argtype is None:
         raise ValueError(f"Unknown type {type_name!r} "
                          f"in argument {name}:{type_name}")
-    return ARG_TYPES[type_name]
+    return argtype
 
 
 class Arg:
@@ -195,7 +244,7 @@ class Arg:
             is_optional (bool): Whether the argument is optional. Defaults to False.
         """
         self.kind = kind
-        self.name = name
+        self.name = intern(name)
         self.type = type_obj or ARG_TYPES["str"]
         self.is_optional = is_optional
 
@@ -203,7 +252,7 @@ class Arg:
 def parse_command(s: str) -> list[Arg]:
     """Parses a command pattern string into an ordered list of Arg objects.
 
-    Recognizes three token forms:
+    Tokens are separated by whitespace and recognized in three forms:
 
     - ``<name>`` or ``<name:type>``: required variable argument.
     - ``[name]`` or ``[name:type]``: optional variable argument.
@@ -224,39 +273,65 @@ def parse_command(s: str) -> list[Arg]:
     saw_variable = False
     saw_optional = False
 
-    for m in TOKEN_REGEX.finditer(s):
-        if m.group("word"):
+    for tok in s.split():
+        m = None
+        if tok[0] == '<' and tok[-1] == '>':
+            m = _VAR_RE.fullmatch(tok, 1, len(tok) - 1)
+        elif tok[0] == '[' and tok[-1] == ']':
+            m = _VAR_RE.fullmatch(tok, 1, len(tok) - 1)
+
+        if m is None:
             if saw_variable or saw_optional:
                 raise ValueError("Keyword arg found after variable arg.")
-            parts.append(Arg("word", m.group("word")))
+            parts.append(Arg("word", tok))
             continue
 
         saw_variable = True
-        if m.group("reqname"):
-            if saw_optional:
-                raise ValueError("Required arg found after optional arg.")
-            name = m.group("reqname")
-            type_obj = parse_argtype(name, m.group("reqtype"))
-
-            if name in arg_names:
-                raise ValueError(f"Duplicate argument name: {name}")
-
-            arg_names.add(name)
-            parts.append(Arg("var", name, type_obj, False))
-        else:
+        is_optional = tok[0] == '['
+        if is_optional:
             saw_optional = True
-            name = m.group("optname")
-            type_obj = parse_argtype(name, m.group("opttype"))
+        elif saw_optional:
+            raise ValueError("Required arg found after optional arg.")
+        name = m.group(1)
+        type_obj = parse_argtype(name, m.group(2))
 
-            if name in arg_names:
-                raise ValueError(f"Duplicate argument name: {name}")
+        if name in arg_names:
+            raise ValueError(f"Duplicate argument name: {name}")
 
-            arg_names.add(name)
-            parts.append(Arg("var", name, type_obj, True))
+        arg_names.add(name)
+        parts.append(Arg("var", name, type_obj, is_optional))
 
     return parts
 
 
+# kinds of the precompiled matching steps of a CommandPattern
+_WORD, _REQUIRED, _OPTIONAL = 0, 1, 2
+
+
+def _compile_step(arg: Arg, /) -> tuple[int, str, Callable[[str], Any]]:
+    """Flattens a parsed Arg into the step tuple consumed by CommandPattern.match.
+
+    Args:
+        arg (Arg): The parsed pattern part.
+
+    Returns:
+        tuple[int, str, Callable[[str], Any]]: The step kind, the word or
+            variable name, and the converter for variables.
+
+    Raises:
+        ValueError: If the argument kind is not recognized.
+    """
+    if arg.kind == "word":
+        return _WORD, arg.name, str
+    elif arg.kind == "var":
+        # self-validating converters can be called without the ArgType wrapper
+        convert = (arg.type.converter if arg.type.self_validating
+                   else arg.type.convert)
+        return (_OPTIONAL if arg.is_optional else _REQUIRED), arg.name, convert
+    else:
+        raise ValueError(f"unknown arg kind: {arg}")
+
+
 class CommandPattern:
     """Parses and matches a command pattern against incoming token lists.
 
@@ -272,10 +347,16 @@ class CommandPattern:
     Attributes:
         pattern_str (str): The original pattern string.
         parts (list[Arg]): The parsed sequence of Arg tokens.
+        first_word (str | None): The leading literal keyword, or None if the
+            pattern starts with a variable argument.
     """
 
     pattern_str: str
     parts: list[Arg]
+    first_word: str | None
+    _steps: tuple[tuple[int, str, Callable[[str], Any]], ...]
+    _min_tokens: int
+    _max_tokens: int
 
     def __init__(self, pattern_str: str):
         """Parses the given pattern string into an ordered list of Arg parts.
@@ -285,40 +366,62 @@ class CommandPattern:
         """
         self.pattern_str = pattern_str
         self.parts = parse_command(pattern_str)
-
-    def match(self, tokens: list[str]) -> dict[str, Any] | None:
+        self.first_word = (self.parts[0].name
+                           if self.parts and self.parts[0].kind == "word"
+                           else None)
+        self._steps = tuple(_compile_step(arg) for arg in self.parts)
+        # every part consumes at most one token, optional ones possibly none
+        self._min_tokens = sum(1 for kind, _, _ in self._steps
+                               if kind != _OPTIONAL)
+        self._max_tokens = len(self._steps)
+
+    def match(self, tokens: list[str], start: int = 0) -> dict[str, Any] | None:
         """Attempts to match a list of tokens against this command pattern.
 
+        Each argument token is converted directly with its type's
+        :meth:`ArgType.convert`; a ``ValueError`` means the pattern does not
+        match. Empty tokens never match an argument.
+
         Args:
             tokens (list[str]): The tokenized input to match.
+            start (int): The number of leading parts already known to match
+                the leading tokens, e.g. 1 after dispatching on
+                :attr:`first_word`. Defaults to 0.
 
         Returns:
             dict[str, Any] | None: A dict mapping variable names to their converted
                 values if the tokens match, or None if they do not.
         """
-        idx = 0
+        n = len(tokens)
+        if n < self._min_tokens or n > self._max_tokens:
+            return None
+        idx = start
         parsed = {}
 
-        for arg in self.parts:
-            if arg.kind == "word":
-                if idx >= len(tokens) or tokens[idx] != arg.name:
+        for kind, name, convert in self._steps[start:] if start else self._steps:
+            if kind == _WORD:
+                if idx >= n or tokens[idx] != name:
                     return None
                 idx += 1
-            elif arg.kind == "var" and not arg.is_optional:
-                if idx >= len(tokens) or not arg.type.is_valid(tokens[idx]):
+            elif kind == _REQUIRED:
+                if idx >= n or not tokens[idx]:
+                    return None
+                try:
+                    parsed[name] = convert(tokens[idx])
+                except (ValueError, KeyError):
                     return None
-                parsed[arg.name] = arg.type.convert(tokens[idx])
                 idx += 1
-            elif arg.kind == "var" and arg.is_optional:
-                if idx < len(tokens) and arg.type.is_valid(tokens[idx]):
-                    parsed[arg.name] = arg.type.convert(tokens[idx])
-                    idx += 1
-                else:
-                    parsed[arg.name] = None
             else:
-                raise ValueError(f"unknown arg kind: {arg}")
-
-        if idx != len(tokens):
+                if idx < n and tokens[idx]:
+                    try:
+                        parsed[name] = convert(tokens[idx])
+                        idx += 1
+                        continue
+                    except (ValueError, KeyError):
+                        pass
+                parsed[name] = None
+
+        if idx != n:
             return None
         return parsed
 
@@ -341,7 +444,11 @@ class CommandPattern:
         """
         if len(pattern.parts) < len(self.parts):
             return False
-        for sarg, parg in zip(self.parts, pattern.parts[:len(self.parts)]):
+        # most pattern pairs are told apart by their leading words alone
+        if (self.first_word is not None and pattern.first_word is not None
+                and self.first_word != pattern.first_word):
+            return False
+        for sarg, parg in zip(self.parts, pattern.parts):
             if sarg.kind == "word":
                 if parg.kind == "word":
                     if sarg.name != parg.name:
@@ -355,7 +462,8 @@ class CommandPattern:
                 if parg.kind == "word":
                     return False
                 elif parg.kind == "var":
-                    if sarg.type != parg.type and parg.type.name != "str":
+                    # argument types are registry singletons
+                    if sarg.type is not parg.type and parg.type.name != "str":
                         return False
                     if sarg.is_optional and not parg.is_optional:
                         return False
@@ -368,6 +476,32 @@ class CommandPattern:
 
 
 CHECK_PATTERN_COVERAGE: bool = True
+_DISPATCH_CACHE_SIZE: int = 1024
+
+
+def _binds_positionally(func: Callable[..., Any], names: tuple[str, ...],
+                        /) -> bool:
+    """Checks whether ``func(ctx, **args)`` can be called as ``func(ctx, *values)``.
+
+    This holds when the parameters following the context are exactly the
+    given names, in order, and each of them accepts a positional argument.
+
+    Args:
+        func (Callable): The command handler.
+        names (tuple[str, ...]): The variable names of a pattern, in pattern
+            order.
+
+    Returns:
+        bool: True if the values can be passed positionally.
+    """
+    try:
+        params = list(signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    if len(params) <= len(names):
+        return False
+    return all(param.name == name and param.kind is Parameter.POSITIONAL_OR_KEYWORD
+               for param, name in zip(params[1:], names))
 
 
 class Command:
@@ -385,11 +519,14 @@ class Command:
             invoked during readline tab-completion to provide argument value
             suggestions.  Called as ``value_completer(arg_name, partial_text)``
             and should return a list of candidate strings.
+        help_text (str | None): The text shown by ``help <command>``, or None
+            to show the docstring of :attr:`func`.
     """
 
     def __init__(self, name: str, func: Callable[..., Any], patterns: list[str],
                  aliases: list[str] | None = None,
-                 value_completer: Callable[[str, str], list[str]] | None = None):
+                 value_completer: Callable[[str, str], list[str]] | None = None,
+                 help_text: str | None = None):
         """Initializes a Command and optionally checks for pattern coverage.
 
         Args:
@@ -403,12 +540,26 @@ class Command:
             value_completer (Callable[[str, str], list[str]] | None): Optional
                 callback ``(arg_name, partial_text) -> [candidate, ...]`` used to
                 complete argument values during readline Tab expansion.
+            help_text (str | None): The text shown by ``help <command>``.
+                Defaults to None, using the docstring of ``func``.
         """
-        self.name = name
-        self.aliases = list(aliases) if aliases else []
+        self.name = intern(name)
+        self.aliases = [intern(alias) for alias in aliases] if aliases else []
         self.value_completer = value_completer
-        self.func = func
         self.patterns = [CommandPattern(p) for p in patterns]
+        # the variable names of each pattern, in the order they are parsed
+        self._var_names = [
+            tuple(a.name for a in p.parts if a.kind == "var")
+            for p in self.patterns
+        ]
+        # subclasses overriding try_match() are matched through it alone
+        self._custom_match = type(self).try_match is not Command.try_match
+        # whether matching the same tokens always gives the same result
+        self._cacheable = not self._custom_match and all(
+            a.type.cacheable
+            for p in self.patterns for a in p.parts if a.kind == "var")
+        self.func = func
+        self.help_text = help_text
         if CHECK_PATTERN_COVERAGE:
             for i, patt in enumerate(self.patterns[1:], 1):
                 for j, other in enumerate(self.patterns[:i]):
@@ -416,6 +567,23 @@ class Command:
                         print(f"Warning: pattern {j + 1} fully covers"
                               f" pattern {i + 1} (command {self.name!r})")
 
+    @property
+    def func(self) -> Callable[..., Any]:
+        return self._func
+
+    @func.setter
+    def func(self, func: Callable[..., Any]) -> None:
+        self._func = func
+        # whether the parsed values of each pattern can be passed positionally,
+        # which subclasses overriding only call() always opt out of
+        cls = type(self)
+        allowed = (cls.call is Command.call
+                   or cls.call_positional is not Command.call_positional)
+        self._positional = [
+            allowed and _binds_positionally(func, names)
+            for names in self._var_names
+        ]
+
     def try_match(self, tokens: list[str]) -> dict[str, Any] | None:
         """Tries each pattern in order and returns the first match result.
 
@@ -432,6 +600,50 @@ class Command:
                 return parsed
         return None
 
+    def _match(self, tokens: list[str]) -> tuple[int, tuple[Any, ...]] | None:
+        """Like :meth:`try_match`, returning the values for :meth:`_call_matched`.
+
+        Args:
+            tokens (list[str]): The tokenized input to match against.
+
+        Returns:
+            tuple[int, tuple[Any, ...]] | None: The index of the matching
+                pattern and the parsed values in pattern order, or None if no
+                pattern matches.  When a subclass overrides :meth:`try_match`,
+                the index is -1 and the values are the ``(name, value)``
+                pairs it returned.
+        """
+        if self._custom_match:
+            parsed = self.try_match(tokens)
+            return None if parsed is None else (-1, tuple(parsed.items()))
+        for index, p in enumerate(self.patterns):
+            parsed = p.match(tokens)
+            if parsed is not None:
+                return index, tuple(parsed.values())
+        return None
+
+    def _call_matched(self, ctx: Any, index: int, values: tuple[Any, ...]) -> Any:
+        """Invokes the handler with the values parsed by a pattern.
+
+        The values are passed through :meth:`call_positional` when the handler
+        accepts them positionally, and through :meth:`call` otherwise.
+
+        Args:
+            ctx: The context object passed as the first argument to the handler.
+            index (int): The index of the pattern that matched, as returned
+                by :meth:`_match`.
+            values (tuple[Any, ...]): The parsed values, as returned by
+                :meth:`_match`.
+
+        Returns:
+            Any: The return value of the handler function.
+        """
+        if index < 0:
+            return self.call(ctx, dict(values))
+        if self._positional[index]:
+            return self.call_positional(ctx, values)
+        return self.call(ctx, dict(zip(self._var_names[index], values)))
+
     def call(self, ctx: Any, parsed_args: dict[str, Any]) -> Any:
         """Invokes the command's handler function with parsed arguments.
 
@@ -445,6 +657,22 @@ class Command:
         """
         return self.func(ctx, **parsed_args)
 
+    def call_positional(self, ctx: Any, values: tuple[Any, ...]) -> Any:
+        """Invokes the command's handler function with parsed values in pattern order.
+
+        Used in place of :meth:`call` for patterns whose variables are the
+        handler's parameters in the same order. Subclasses that override only
+        :meth:`call` are always invoked through it.
+
+        Args:
+            ctx: The context object passed as the first argument to the handler.
+            values (tuple[Any, ...]): The parsed values, in pattern order.
+
+        Returns:
+            Any: The return value of the handler function.
+        """
+        return self.func(ctx, *values)
+
 
 def tokenize(s: str) -> list[str]:
     """Splits a command string into tokens, respecting quoted strings and escapes.
@@ -458,40 +686,28 @@ def tokenize(s: str) -> list[str]:
     Returns:
         list[str]: The list of extracted tokens.
     """
-    tokens = []
-    buf = []
-    in_quotes = False
-    escape = False
-    quote_char = None
-
-    for ch in s:
-        if escape:
-            buf.append(ch)
-            escape = False
-            continue
-        if ch == '\\':
-            escape = True
-            continue
-        if in_quotes:
-            if ch == quote_char:
-                in_quotes = False
-                quote_char = None
-            else:
-                buf.append(ch)
-            continue
-        if ch in ("'", '"'):
-            in_quotes = True
-            quote_char = ch
-            continue
-        if ch.isspace():
-            if buf:
-                tokens.append("".join(buf))
-                buf = []
-            continue
-        buf.append(ch)
+    if '"' not in s and "'" not in s and '\\' not in s:
+        return s.split()
 
-    if buf:
-        tokens.append("".join(buf))
+    tokens = []
+    for tok in _TOKEN_SCAN.findall(s):
+        q = tok[0]
+        if (q == '"' or q == "'") and tok[-1] == q and tok.count(q) == 2 \
+                and '\\' not in tok:
+            # the common case: one quoted string without escapes
+            tok = tok[1:-1]
+            if not tok:
+                continue
+        elif '"' in tok or "'" in tok or '\\' in tok:
+            # drop the quote delimiters, then resolve the escapes, each in
+            # one pass over the whole token
+            if '"' in tok or "'" in tok:
+                tok = _unquote(tok)
+            if '\\' in tok:
+                tok = _unescape(tok)
+            if not tok:
+                continue
+        tokens.append(tok)
     return tokens
 
 
@@ -509,14 +725,28 @@ class CLIEngine:
             via :meth:`run_command` or :meth:`read_command`.
     """
 
-    def __init__(self) -> None:
-        """Initializes the CLIEngine and registers the built-in commands."""
+    def __init__(self, exit_help: str | None = None) -> None:
+        """Initializes the CLIEngine and registers the built-in commands.
+
+        Args:
+            exit_help (str | None): The help text of the built-in ``exit``
+                command, e.g. to tell what exiting does in the application.
+                Defaults to None, using the generic one.
+        """
         self.commands: dict[str, Command] = {}
         self.history: list[str] = []
+        # (command, pattern, pattern index) entries indexed by the pattern's
+        # leading word
+        self._dispatch: dict[str, list[tuple[Command, CommandPattern, int]]] = {}
+        self._has_unanchored: bool = False
+        # whether every registered command can be looked up through the cache
+        self._cacheable: bool = True
+        self._cached_lookup = lru_cache(
+            maxsize=_DISPATCH_CACHE_SIZE)(self._lookup)
         self._readline_setup: bool = False
         self._input_locked: bool = False
         self._input_buffer: list[str] = []
-        self._register_builtin_commands()
+        self._register_builtin_commands(exit_help)
 
     def register(self, cmd: Command) -> None:
         """Registers a Command object with the engine.
@@ -540,12 +770,26 @@ class CLIEngine:
         self.commands[cmd.name] = cmd
         for alias in cmd.aliases:
             self.commands[alias] = cmd
-        # invalidate cached completions whenever commands change
+        if not cmd._cacheable:
+            self._cacheable = False
+        if cmd._custom_match:
+            # a custom try_match() can match input its patterns don't start
+            # with, so every lookup scans the commands in order
+            self._has_unanchored = True
+        for index, pattern in enumerate(cmd.patterns):
+            if pattern.first_word is None:
+                self._has_unanchored = True
+            else:
+                self._dispatch.setdefault(
+                    pattern.first_word, []).append((cmd, pattern, index))
+        # invalidate cached completions and lookups whenever commands change
         self._readline_setup = False
+        self._cached_lookup.cache_clear()
 
     def add_command(self, name: str, patterns: list[str],
                     aliases: list[str] | None = None,
-                    value_completer: Callable[[str, str], list[str]] | None = None) -> Callable[..., Any]:
+                    value_completer: Callable[[str, str], list[str]] | None = None,
+                    help_text: str | None = None) -> Callable[..., Any]:
         """Returns a decorator that registers the decorated function as a command.
 
         Args:
@@ -556,6 +800,8 @@ class CLIEngine:
             value_completer (Callable[[str, str], list[str]] | None): Optional
                 callback ``(arg_name, partial_text) -> [candidate, ...]`` used
                 during readline Tab completion to suggest argument values.
+            help_text (str | None): The text shown by ``help <command>``.
+                Defaults to None, using the docstring of the function.
 
         Returns:
             Callable: A decorator that wraps the function in a ``Command``,
@@ -563,12 +809,18 @@ class CLIEngine:
         """
         def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
             self.register(Command(name, func, patterns, aliases=aliases,
-                                  value_completer=value_completer))
+                                  value_completer=value_completer,
+                                  help_text=help_text))
             return func
         return wrapper
 
-    def _register_builtin_commands(self) -> None:
-        """Registers the built-in ``help``, ``exit``, and ``repeat`` commands."""
+    def _register_builtin_commands(self, exit_help: str | None) -> None:
+        """Registers the built-in ``help``, ``exit``, and ``repeat`` commands.
+
+        Args:
+            exit_help (str | None): The help text of ``exit``, or None for the
+                default one.
+        """
         self.register(Command(
             name="help",
             func=self._cmd_help,
@@ -578,7 +830,8 @@ class CLIEngine:
         self.register(Command(
             name="exit",
             func=self._cmd_exit,
-            patterns=["exit", "quit"]
+            patterns=["exit", "quit"],
+            help_text=exit_help,
         ))
 
         self.register(Command(
@@ -622,8 +875,10 @@ class CLIEngine:
             lines.append(f"Aliases: {', '.join(cmd.aliases)}")
         for p in cmd.patterns:
             lines.append(f"- {p.pattern_str}")
-        if cmd.func.__doc__:
-            lines.append('\n' + cmd.func.__doc__.strip())
+        help_text = (cmd.func.__doc__ if cmd.help_text is None
+                     else cmd.help_text)
+        if help_text:
+            lines.append('\n' + help_text.strip())
         content = "\n".join(lines)
         return {"type": "help", "content": content}
 
@@ -670,10 +925,11 @@ class CLIEngine:
         added to the internal buffer and ``{'type': 'buffered'}`` is returned
         without dispatching.
 
-        Iterates over all registered commands and returns the result of the first
-        matching one.  When the first token matches a command alias, it is
-        substituted with the canonical command name before pattern matching so
-        that alias users see identical behaviour to the canonical name.
+        The command named by the first token is tried first.  When the first
+        token matches a command alias, it is substituted with the canonical
+        command name before pattern matching so that alias users see identical
+        behaviour to the canonical name.  Otherwise only the patterns whose
+        leading word equals the first token are tried, in registration order.
 
         If no command matches, returns an unknown-command result dict.
 
@@ -690,6 +946,29 @@ class CLIEngine:
             self._input_buffer.append(text)
             return {"type": "buffered"}
 
+        lookup = self._cached_lookup if self._cacheable else self._lookup
+        first, cmd, index, values = lookup(text)
+        if cmd is None:
+            return {"type": "unknown_command", "text": text, "command": first}
+        return cast(dict[str, Any], cmd._call_matched(ctx, index, values))
+
+    def _lookup(self, text: str) -> tuple[str, Command | None, int, tuple[Any, ...]]:
+        """Tokenizes a text command and finds the command and arguments it matches.
+
+        While every registered argument type is :attr:`ArgType.cacheable`
+        and no command overrides :meth:`Command.try_match`,
+        :meth:`run_command` calls this through a per-engine LRU cache keyed
+        on ``text``.  The cache is cleared by :meth:`register`.
+
+        Args:
+            text (str): The raw command input string.
+
+        Returns:
+            tuple: ``(first_token, command, index, values)`` where
+                ``command`` is the matched Command or None, ``index`` the
+                index of its matching pattern, and ``values`` the parsed
+                values in pattern order.
+        """
         tokens = tokenize(text)
 
         first = tokens[0] if tokens else ""
@@ -698,16 +977,26 @@ class CLIEngine:
             # If dispatched via alias, replace first token with canonical name
             if first != cmd.name:
                 tokens = [cmd.name] + tokens[1:]
-            parsed = cmd.try_match(tokens)
-            if parsed is not None:
-                return cast(dict[str, Any], cmd.call(ctx, parsed))
-
-        for cmd in self.commands.values():
-            parsed = cmd.try_match(tokens)
-            if parsed is not None:
-                return cast(dict[str, Any], cmd.call(ctx, parsed))
+            result = cmd._match(tokens)
+            if result is not None:
+                return first, cmd, *result
+
+        if self._has_unanchored:
+            # patterns starting with a variable (or custom try_match()
+            # overrides) can't be indexed by word
+            for cmd in self.commands.values():
+                result = cmd._match(tokens)
+                if result is not None:
+                    return first, cmd, *result
+        else:
+            # keyed on the canonical name when the first token was an alias
+            for cmd, pattern, index in self._dispatch.get(
+                    tokens[0] if tokens else "", ()):
+                parsed = pattern.match(tokens, 1)
+                if parsed is not None:
+                    return first, cmd, index, tuple(parsed.values())
 
-        return {"type": "unknown_command", "text": text, "command": first}
+        return first, None, 0, ()
 
     # ------------------------------------------------------------------
     # Input locking (narrations / dialogues)
@@ -868,7 +1157,7 @@ class CLIEngine:
             self.setup_readline(
                 getattr(self, "_readline_history_file", None)
             )
-        text = input(prompt).strip()
+        text = read_line(prompt).strip()
         if text:
             self.push_history(text)
             history_file = getattr(self, "_readline_history_file", None)
@@ -1,7 +1,8 @@
 from collections.abc import Callable
 from io import TextIOWrapper
-from re import fullmatch
-from typing import Any, Self
+from keyword import iskeyword
+from re import compile as re_compile
+from typing import Any, Self, TypeVar, cast
 
 from myjson import load as json_load, dump as json_dump
 from str_convert import to_snake_case
@@ -10,7 +11,7 @@ from utils import TypeLike, istype
 
 __all__ = [
     "Variable", "get_var",
-    "DataType",
+    "DataType", "with_slots",
 ]
 
 
@@ -18,6 +19,8 @@ Immutable = int | float | complex | bool | str | tuple[Any,
                                                        ...] | bytes | range | frozenset[Any]
 _IMMUTABLE_CLASSES = (int, float, complex, bool, str,
                       tuple, bytes, range, frozenset)
+_MISSING: Any = object()
+_NAME_REGEX = re_compile(r"[A-Za-z_]\w*")
 
 
 class Variable:
@@ -29,6 +32,7 @@ class Variable:
         default (Any | None): A static default value, or None if not set.
         default_factory (Callable[[], Any] | None): A callable that produces a
             default value, or None if not set.
+        optional (bool): Whether a default or default factory is set.
         validator (Callable[[Any], bool] | None): An optional callable that
             validates a given value, or None to skip validation.
         loader (Callable[[Any], dict] | None): An optional callable to transform
@@ -37,10 +41,14 @@ class Variable:
             a value on dump, or None to use the raw value.
     """
 
+    __slots__ = ("name", "type", "default", "default_factory", "optional",
+                 "validator", "loader", "dumper", "_default_value")
+
     name: str
     type: TypeLike
     default: Any | None
     default_factory: Callable[[], Any] | None
+    optional: bool
     validator: Callable[[Any], bool] | None
     loader: Callable[[Any], dict[str, Any]] | None
     dumper: Callable[[Any], dict[str, Any]] | None
@@ -74,7 +82,7 @@ class Variable:
                 ``'DUMP_DEFAULTS'``.
             ValueError: If both ``default`` and ``default_factory`` are provided.
         """
-        if not fullmatch(r"[A-Za-z_]\w*", name):
+        if not _NAME_REGEX.fullmatch(name):
             raise NameError(
                 f"variable name must be contain only letters,"
                 f" non-leading digits, and underscores, not {name!r}")
@@ -99,6 +107,8 @@ class Variable:
                 "both default and default_factory are given, conflict")
         self.default = default
         self.default_factory = default_factory
+        # static defaults are returned as is by default_value
+        self._default_value = _MISSING if default is None else default
         self.optional = self.default is not None or self.default_factory is not None
         self.validator = validator
         self.loader = loader
@@ -144,8 +154,9 @@ class Variable:
         Raises:
             ValueError: If neither ``default`` nor ``default_factory`` is set.
         """
-        if self.default is not None:
-            return self.default
+        value = self._default_value
+        if value is not _MISSING:
+            return value
         elif self.default_factory is not None:
             return self.default_factory()
         else:
@@ -203,12 +214,226 @@ def get_var(variables: list[Variable], name: str, /) -> Variable | None:
     return None
 
 
+def _build_init(cls: type["DataType"]) -> Callable[..., None] | None:
+    """Generates an ``__init__`` specialized to the variables of a DataType subclass.
+
+    The variables of a subclass are fixed once it is defined, so the argument
+    handling of the generic ``DataType.__init__`` is compiled into a plain
+    signature, with type checks, validators and defaults unrolled per variable.
+    Instances of subclasses with other variables, reaching it through
+    ``super()``, are initialized by the generic ``DataType.__init__``.
+
+    Args:
+        cls (type[DataType]): The DataType subclass to generate for.
+
+    Returns:
+        Callable[..., None] | None: The generated initializer, or None if a
+            variable name cannot be used as a parameter name.
+    """
+    # every name the generated code refers to lives here, so that no
+    # parameter can shadow it
+    ns: dict[str, Any] = {
+        "_MISSING": _MISSING, "_istype": istype, "isinstance": isinstance,
+        "type": type, "TypeError": TypeError, "ValueError": ValueError,
+    }
+    params = ["self"]
+    lines = []
+    for i, var in enumerate(cls.variables):
+        name = var.name
+        ns[f"_type_{i}"] = var.type
+        indent = "    "
+        if var.optional:
+            params.append(f"{name}=_MISSING")
+            lines.append(f"    if {name} is _MISSING:")
+            if var.default is not None:
+                ns[f"_default_{i}"] = var.default
+                lines.append(f"        {name} = _default_{i}")
+            else:
+                ns[f"_factory_{i}"] = var.default_factory
+                lines.append(f"        {name} = _factory_{i}()")
+            lines.append("    else:")
+            indent = "        "
+        else:
+            params.append(name)
+        if isinstance(var.type, type) and var.type is not Any:
+            check = f"isinstance({name}, _type_{i})"
+        else:
+            check = f"_istype({name}, _type_{i})"
+        lines.append(f"{indent}if not {check}:")
+        lines.append(f"{indent}    raise TypeError(f\"expected {{_type_{i}}} for variable"
+                     f" {name!r}, got {{{name}}} ({{type({name}).__name__}})\")")
+        if var.validator is not None:
+            ns[f"_validator_{i}"] = var.validator
+            lines.append(f"{indent}if not _validator_{i}({name}):")
+            lines.append(f"{indent}    raise ValueError(f\"invalid value for"
+                         f" variable {name!r}: {{{name}!r}}\")")
+        lines.append(f"    self.{name} = {name}")
+
+    for var in cls.variables:
+        if iskeyword(var.name) or var.name in ns or var.name == "self":
+            return None
+
+    src = f"def __init__({', '.join(params)}):\n"
+    src += "\n".join(lines) if lines else "    pass"
+    init = _compile_method(cls, "__init__", src, ns)
+    src = "\n".join([
+        "def __init__(self, *args, **kwargs):",
+        "    if type(self).variables is not _variables:",
+        "        return _generic(self, *args, **kwargs)",
+        "    _init(self, *args, **kwargs)",
+    ])
+    ns = {"type": type, "_variables": cls.variables, "_init": init,
+          "_generic": DataType.__init__}
+    return cast("Callable[..., None]", _compile_method(cls, "__init__", src, ns))
+
+
+def _build_dumps(cls: type["DataType"]) -> Callable[..., dict[str, Any]] | None:
+    """Generates a ``dumps`` specialized to the variables of a DataType subclass.
+
+    Dumpers are only called for variables that define one, and the default
+    comparison is only emitted for optional variables. Instances of
+    subclasses with other variables are dumped by the generic
+    ``DataType.dumps``.
+
+    Args:
+        cls (type[DataType]): The DataType subclass to generate for.
+
+    Returns:
+        Callable[..., dict[str, Any]] | None: The generated method, or None if
+            a variable name cannot be used as an attribute name.
+    """
+    if any(iskeyword(var.name) for var in cls.variables):
+        return None
+    ns: dict[str, Any] = {"type": type, "_variables": cls.variables,
+                          "_generic": DataType.dumps}
+    lines = [
+        "def dumps(self):",
+        "    if type(self).variables is not _variables:",
+        "        return _generic(self)",
+        "    skip_defaults = not self.DUMP_DEFAULTS",
+        "    result = {}",
+    ]
+    for i, var in enumerate(cls.variables):
+        lines.append(f"    value = self.{var.name}")
+        indent = "    "
+        if var.optional:
+            if var.default is not None:
+                ns[f"_default_{i}"] = var.default
+                default = f"_default_{i}"
+            else:
+                ns[f"_factory_{i}"] = var.default_factory
+                default = f"_factory_{i}()"
+            lines.append(f"    if not (skip_defaults and value == {default}):")
+            indent = "        "
+        if var.dumper is not None:
+            ns[f"_dumper_{i}"] = var.dumper
+            lines.append(f"{indent}result[{var.name!r}] = _dumper_{i}(value)")
+        else:
+            lines.append(f"{indent}result[{var.name!r}] = value")
+    lines.append("    result['type'] = self.datatype_id")
+    lines.append("    return result")
+    return cast("Callable[..., dict[str, Any]]",
+                _compile_method(cls, "dumps", "\n".join(lines), ns))
+
+
+def _build_loads(cls: type["DataType"]) -> Any:
+    """Generates a ``loads`` specialized to the variables of a DataType subclass.
+
+    Loaders are only called for variables that define one, and missing
+    variables resolve straight to their default or raise. Subclasses with
+    other variables are loaded by the generic ``DataType.loads``.
+
+    Args:
+        cls (type[DataType]): The DataType subclass to generate for.
+
+    Returns:
+        Any: The generated class method.
+    """
+    ns: dict[str, Any] = {"TypeError": TypeError, "NameError": NameError,
+                          "_variables": cls.variables,
+                          "_generic": DataType.__dict__["loads"].__func__}
+    lines = [
+        "def loads(cls, obj, /):",
+        "    if cls.variables is not _variables:",
+        "        return _generic(cls, obj)",
+        "    if 'type' not in obj:",
+        "        raise TypeError(f'type tag missing from data.')",
+        "    elif obj['type'] != cls.datatype_id:",
+        "        raise TypeError(f'expected type tag {cls.datatype_id!r},'",
+        "                        f' got {obj[\"type\"]}')",
+    ]
+    for i, var in enumerate(cls.variables):
+        key = repr(var.name)
+        lines.append(f"    if {key} in obj:")
+        if var.loader is not None:
+            ns[f"_loader_{i}"] = var.loader
+            lines.append(f"        value_{i} = _loader_{i}(obj[{key}])")
+        else:
+            lines.append(f"        value_{i} = obj[{key}]")
+        lines.append("    else:")
+        if var.default is not None:
+            ns[f"_default_{i}"] = var.default
+            lines.append(f"        value_{i} = _default_{i}")
+        elif var.default_factory is not None:
+            ns[f"_factory_{i}"] = var.default_factory
+            lines.append(f"        value_{i} = _factory_{i}()")
+        else:
+            lines.append(f"        raise NameError(\"variable {key} not found from data.\")")
+    values = ", ".join(f"value_{i}" for i in range(len(cls.variables)))
+    lines.append(f"    return cls({values})")
+    return classmethod(_compile_method(cls, "loads", "\n".join(lines), ns))
+
+
+def _compile_method(cls: type["DataType"], name: str, src: str,
+                    ns: dict[str, Any]) -> Any:
+    """Compiles the source of a generated DataType method.
+
+    Args:
+        cls (type[DataType]): The DataType subclass the method is for.
+        name (str): The name of the method defined by ``src``.
+        src (str): The source code of the function definition.
+        ns (dict[str, Any]): The globals the function is executed with.
+
+    Returns:
+        Any: The compiled function, marked as generated.
+    """
+    exec(src, ns)
+    func = ns[name]
+    func.__qualname__ = f"{cls.__qualname__}.{name}"
+    func.__doc__ = getattr(DataType, name).__doc__
+    func._datatype_generated = True
+    return func
+
+
+def _is_generic(cls: type["DataType"], name: str) -> bool:
+    """Checks whether a DataType subclass uses a replaceable version of a method.
+
+    A method is replaceable if it is neither defined on the class itself nor
+    inherited from a hand-written override, only from DataType or generated.
+
+    Args:
+        cls (type[DataType]): The DataType subclass to check.
+        name (str): The name of the method.
+
+    Returns:
+        bool: True if the method may be replaced by a generated one.
+    """
+    if name in cls.__dict__:
+        return False
+    method = getattr(cls, name)
+    func = getattr(method, "__func__", method)
+    base = getattr(DataType, name)
+    return (func is getattr(base, "__func__", base)
+            or getattr(func, "_datatype_generated", False))
+
+
 class DataType:
     """Base class for defining structured data types with typed, named variables.
 
     Subclasses must define a ``variables`` class attribute as a list of
     ``Variable`` instances. A ``datatype_id`` class attribute is auto-generated
-    from the subclass name in snake_case if not explicitly provided.
+    from the subclass name in snake_case if not explicitly provided. Use
+    ``with_slots`` to store the values of instances in ``__slots__``.
 
     Attributes:
         datatype_id (str): A unique string identifier, defaulting to the
@@ -219,9 +444,12 @@ class DataType:
             Defaults to False.
     """
 
+    __slots__ = ()
+
     datatype_id: str
     variables: list[Variable]
     DUMP_DEFAULTS: bool = False
+    _var_by_name: dict[str, Variable]
 
     def __init_subclass__(cls) -> None:
         """Validates and configures a DataType subclass when it is defined.
@@ -271,6 +499,17 @@ class DataType:
                 raise ValueError(
                     f"for mutable default values, use getter functions with"
                     f" default_factory instead of default: {var.name}")
+        cls._var_by_name = {var.name: var for var in variables}
+
+        # generate specialized methods, unless they are defined by hand
+        builders: dict[str, Callable[[type[DataType]], Any]] = {
+            "__init__": _build_init, "dumps": _build_dumps, "loads": _build_loads,
+        }
+        for name, build in builders.items():
+            if _is_generic(cls, name):
+                method = build(cls)
+                if method is not None:
+                    setattr(cls, name, method)
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Instantiates a DataType with positional and/or keyword argument values.
@@ -290,14 +529,15 @@ class DataType:
                 required variable is missing, or a value is of the wrong type.
             ValueError: If a value fails its variable's validator.
         """
-        if len(args) + len(kwargs) > len(self.variables):
+        variables = self.variables
+        if len(args) + len(kwargs) > len(variables):
             raise TypeError(f"{self.__class__.__name__}() takes at most"
-                            f" {len(self.variables)} arguments"
+                            f" {len(variables)} arguments"
                             f" ({len(args) + len(kwargs)} given)")
 
         used_names = {*()}
         for i, value in enumerate(args):
-            var = self.variables[i]
+            var = variables[i]
             used_names.add(var.name)
             if not istype(value, var.type):
                 raise TypeError(
@@ -310,7 +550,7 @@ class DataType:
             setattr(self, var.name, value)
 
         for key, value in kwargs.items():
-            var = get_var(self.variables, key)  # type: ignore[assignment]
+            var = self._var_by_name.get(key)  # type: ignore[assignment]
             if var is None:
                 raise TypeError(
                     f"{self.__class__.__name__}() got an unexpected"
@@ -329,15 +569,15 @@ class DataType:
             used_names.add(var.name)
             setattr(self, key, value)
 
-        for pos, var in enumerate(self.variables, 1):
+        for pos, var in enumerate(variables, 1):
             if var.optional:
                 break
             elif var.name not in used_names:
                 raise TypeError(
                     f"{self.__class__.__name__}() missing required"
                     f" argument {var.name!r} (pos {pos})")
-        for var in self.variables:
-            if var.optional and not hasattr(self, var.name):
+        for var in variables:
+            if var.optional and var.name not in used_names:
                 setattr(self, var.name, var.default_value)
 
     def __repr__(self) -> str:
@@ -419,6 +659,71 @@ class DataType:
         return True
 
 
+_D = TypeVar("_D", bound=DataType)
+
+
+def with_slots(cls: type[_D], /) -> type[_D]:
+    """Rebuilds a DataType subclass with ``__slots__`` for its variables.
+
+    Meant as a class decorator, like ``dataclass(slots=True)``. Instances of
+    the returned class keep their values in slots instead of an instance
+    ``__dict__``, so they are smaller but cannot hold attributes other than
+    their variables. Weak references to them are still supported.
+    Subclasses of the returned class get an instance ``__dict__`` again
+    unless they are decorated too.
+
+    Args:
+        cls (type[DataType]): The DataType subclass to rebuild.
+
+    Returns:
+        type[DataType]: The rebuilt class.
+
+    Raises:
+        TypeError: If ``cls`` is not a DataType subclass, already defines
+            ``__slots__``, or has a variable that cannot be given a slot.
+    """
+    if not (isinstance(cls, type) and issubclass(cls, DataType)) or cls is DataType:
+        raise TypeError(f"with_slots() expects a DataType subclass, not {cls!r}")
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already defines __slots__")
+    base_slots = {slot for base in cls.__mro__[1:]
+                  for slot in base.__dict__.get("__slots__", ())}
+    names = [var.name for var in cls.variables if var.name not in base_slots]
+    for name in names:
+        # slots of private names are mangled, unlike the attributes set
+        if (name in cls.__dict__
+                or name.startswith("__") and not name.endswith("__")):
+            raise TypeError(f"variable {name!r} of {cls.__name__}"
+                            f" cannot be given a slot")
+    if not any(base.__weakrefoffset__ for base in cls.__bases__):
+        names.append("__weakref__")
+
+    # generated methods are built again for the new class
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in ("__dict__", "__weakref__")
+        and not getattr(getattr(value, "__func__", value),
+                        "_datatype_generated", False)
+    }
+    namespace["__slots__"] = tuple(names)
+    metaclass: Any = type(cls)
+    new_cls = cast("type[_D]", metaclass(cls.__name__, cls.__bases__, namespace))
+
+    # point the __class__ cells of zero-argument super() at the new class
+    for value in namespace.values():
+        funcs = ((value.fget, value.fset, value.fdel)
+                 if isinstance(value, property)
+                 else (getattr(value, "__func__", value),))
+        for func in funcs:
+            for cell in getattr(func, "__closure__", None) or ():
+                try:
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = new_cls
+                except ValueError:
+                    pass
+    return new_cls
+
+
 def main() -> None:
     class Sword(DataType):
         name: str
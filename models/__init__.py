@@ -1,13 +1,36 @@
-from .data import *
-from .data import __all__ as __data_all__
-from .profile import *
-from .profile import __all__ as __profile_all__
-from .context import *
-from .context import __all__ as __context_all__
-from .launcher import *
-from .launcher import __all__ as __launcher_all__
+from .data import (
+    ItemType,
+    Item,
+    Location,
+    NPC,
+    Achievement,
+    Event,
+    Quest,
+    SkillType,
+)
+from .profile import (
+    PlayerProfile,
+    PROFILE_SAVE_VERSION,
+)
+from .context import GameContext
+from .launcher import (
+    GameLauncher,
+    DEFAULT_LAUNCHER_SETTINGS,
+)
 
 
-__all__ = (
-    __data_all__ + __profile_all__ + __context_all__ + __launcher_all__
-)
+__all__ = [
+    "ItemType",
+    "Item",
+    "Location",
+    "NPC",
+    "Achievement",
+    "Event",
+    "Quest",
+    "SkillType",
+    "PlayerProfile",
+    "PROFILE_SAVE_VERSION",
+    "GameContext",
+    "GameLauncher",
+    "DEFAULT_LAUNCHER_SETTINGS",
+]
@@ -16,10 +16,50 @@ __all__ = [
 ]
 
 
+#: API response types the game loop prints nothing for.
+_SILENT_RESPONSES = frozenset({"success"})
+
+
+def _print_help(theme: ColorTheme, api: dict[str, Any], /) -> None:
+    print('\n' + api["content"] + '\n')
+
+
+def _print_unknown_command(theme: ColorTheme, api: dict[str, Any], /) -> None:
+    print(theme.error(f"Unknown command: {api['command']!r}."))
+    print(theme.info(f"Use 'help' for a list of commands available."))
+
+
+# printers by API response type, looked up once per command
+_RESPONSE_PRINTERS: dict[str, Callable[[ColorTheme, dict[str, Any]], None]] = {
+    "help": _print_help,
+    "unknown_command": _print_unknown_command,
+}
+
+
+def print_response(theme: ColorTheme, api: dict[str, Any],
+                   silent_types: frozenset[str], unknown_message: str, /) -> None:
+    """Prints the feedback for the API response of a command in a run loop.
+
+    Args:
+        theme (ColorTheme): The theme to print with.
+        api (dict[str, Any]): The API response of the command.
+        silent_types (frozenset[str]): The response types to print nothing for.
+        unknown_message (str): The warning printed, followed by the type, for
+            response types without a printer.
+    """
+    api_type = api["type"]
+    if api_type in silent_types:
+        return
+    printer = _RESPONSE_PRINTERS.get(api_type)
+    if printer is None:
+        print(theme.warning(f"{unknown_message}: {api_type}"))
+    else:
+        printer(theme, api)
+
+
 class GameContext:
     profile: PlayerProfile
-    engine: CLIEngine = CLIEngine()
-    engine.commands["exit"].__doc__ = "Exit and save game."
+    engine: CLIEngine = CLIEngine(exit_help="Exit and save game.")
     working_directory: Path
     settings: dict[str, Any] | None
     session_start_time: float | None
@@ -247,21 +287,10 @@ class GameContext:
                     continue
 
                 api = self.engine.run_command(self, command)
-                match api["type"]:
-                    case "exit":
-                        break
-                    case "help":
-                        print('\n' + api["content"] + '\n')
-                    case "success":
-                        continue
-                    case "unknown_command":
-                        print(self.theme.error(
-                            f"Unknown command: {api['command']!r}."))
-                        print(self.theme.info(
-                            f"Use 'help' for a list of commands available."))
-                    case other:
-                        print(self.theme.warning(
-                            f"Unknown API response: {other}"))
+                if api["type"] == "exit":
+                    break
+                print_response(self.theme, api, _SILENT_RESPONSES,
+                               "Unknown API response")
         finally:
             self.stop_autosave()
 
@@ -1,16 +1,17 @@
+from os.path import exists, join
 from pathlib import Path
 from typing import Any
 
 from cliengine import CLIEngine
 from color import ColorTheme, DEFAULT_THEME, DARK_THEME, LIGHT_THEME
-from myjson import load
 from profile_manage import (
     get_profiles, init_working_folder, init_settings,
-    load_settings, save_settings, generate_unique_profile_id,
+    load_settings, save_settings, save_profile_data,
+    generate_unique_profile_id, read_json,
 )
 from utils import catch_interrupt, catch_interrupt_with_api, match_input
 
-from .context import GameContext
+from .context import GameContext, print_response
 from .profile import PlayerProfile
 
 
@@ -26,6 +27,9 @@ DEFAULT_LAUNCHER_SETTINGS: dict[str, Any] = {
     "auto_save_interval": 0,        # seconds; 0 = disabled
 }
 
+#: API response types the launcher loop prints nothing for.
+_SILENT_RESPONSES = frozenset({"success", "failed", "interrupted"})
+
 _THEME_MAP = {
     "default": DEFAULT_THEME,
     "dark": DARK_THEME,
@@ -34,8 +38,7 @@ _THEME_MAP = {
 
 
 class GameLauncher:
-    engine: CLIEngine = CLIEngine()
-    engine.commands["exit"].__doc__ = "Exit game launcher."
+    engine: CLIEngine = CLIEngine(exit_help="Exit game launcher.")
     working_directory: Path
     settings: dict[str, Any] | None
 
@@ -47,6 +50,7 @@ class GameLauncher:
         self.context_cls = context_cls
         self.profile_cls = profile_cls
         self.working_directory = Path(working_directory)
+        self._saves_dir = self.working_directory / "saves"
 
     def launch_message(self) -> None:
         print(self.theme.heading("Game Launcher Running."))
@@ -85,6 +89,7 @@ class GameLauncher:
         print(self.theme.info("Please enter the ID of the profile."))
         print(self.theme.info(
             f"Leave empty for auto-generated one: {unique_id!r}"))
+        saves_dir = str(self._saves_dir)
         while True:
             profile_id = match_input(r"^[a-zA-Z0-9_-]*$")
             if profile_id is None:
@@ -93,7 +98,7 @@ class GameLauncher:
                 profile_id = unique_id
             else:
                 profile_id = profile_id.strip()
-            if (self.working_directory / "saves" / f"{profile_id}.json").exists():
+            if exists(join(saves_dir, f"{profile_id}.json")):
                 print(self.theme.error(
                     "Profile ID taken, please choose another one."))
             else:
@@ -109,7 +114,7 @@ class GameLauncher:
         """
         Play the selected profile by ID.
         """
-        filepath = (self.working_directory / "saves" /
+        filepath = (self._saves_dir /
                     f"{profile_id.removesuffix('.json')}.json")
         if not filepath.is_file():
             print(self.theme.error(
@@ -117,8 +122,7 @@ class GameLauncher:
             return {"type": "failed"}
 
         try:
-            with open(filepath) as file:
-                obj = load(file)
+            obj = read_json(filepath)
         except Exception:
             print(self.theme.error(
                 "Failed to load: Profile has invalid JSON structure."))
@@ -141,7 +145,7 @@ class GameLauncher:
         """
         Delete the selected profile by ID.
         """
-        filepath = (self.working_directory / "saves" /
+        filepath = (self._saves_dir /
                     f"{profile_id.removesuffix('.json')}.json")
         if not filepath.is_file():
             print(self.theme.error(
@@ -167,7 +171,7 @@ class GameLauncher:
         Rename the selected profile by ID.
         New name and ID will be prompted for.
         """
-        filepath = (self.working_directory / "saves" /
+        filepath = (self._saves_dir /
                     f"{old_profile_id.removesuffix('.json')}.json")
         if not filepath.is_file():
             print(self.theme.error(
@@ -175,21 +179,26 @@ class GameLauncher:
             return {"type": "failed"}
 
         try:
-            with open(filepath) as file:
-                obj = load(file)
+            obj = read_json(filepath)
         except Exception:
             print(self.theme.error(
                 "Failed to rename: Profile has invalid JSON structure."))
             return {"type": "failed"}
+        # only the name and ID are needed, so the profile itself is never
+        # built and the rest of the data is written back untouched
         try:
-            profile = self.profile_cls.loads(obj)
+            if obj["type"] != self.profile_cls.datatype_id:
+                raise ValueError
+            old_profile_name, old_id = obj["name"], obj["id"]
+            if not (isinstance(old_profile_name, str)
+                    and isinstance(old_id, str)):
+                raise ValueError
         except Exception:
             print(self.theme.error("Failed to rename: Profile has invalid data."))
             return {"type": "failed"}
 
-        old_profile_name = profile.name
         print(self.theme.info(f"Original profile name: {old_profile_name!r}"))
-        print(self.theme.info(f"Original profile ID: {profile.id!r}"))
+        print(self.theme.info(f"Original profile ID: {old_id!r}"))
 
         print(self.theme.info("Please enter the new name for this profile."))
         new_profile_name = match_input(r".*[^\s]+.*")
@@ -204,6 +213,7 @@ class GameLauncher:
         print(self.theme.info("Please enter the ID of the profile."))
         print(self.theme.info(
             f"Leave empty for auto-generated one: {unique_id!r}"))
+        saves_dir = str(self._saves_dir)
         while True:
             new_profile_id = match_input(r"^[a-zA-Z0-9_-]*$")
             if new_profile_id is None:
@@ -212,16 +222,21 @@ class GameLauncher:
                 new_profile_id = unique_id
             else:
                 new_profile_id = new_profile_id.strip()
-            if (self.working_directory / "saves" / f"{new_profile_id}.json").exists():
+            # keeping the current ID saves in place
+            if (new_profile_id != filepath.stem
+                    and exists(join(saves_dir, f"{new_profile_id}.json"))):
                 print(self.theme.error(
                     "Profile ID taken, please choose another one."))
             else:
                 break
 
-        profile.name = new_profile_name
-        profile.id = new_profile_id
-        profile.save(self.working_directory)
-        filepath.unlink()
+        obj["name"] = new_profile_name
+        obj["id"] = new_profile_id
+        # the new file is written atomically before the old one is removed,
+        # so the profile is never missing from disk
+        save_profile_data(self.working_directory, obj)
+        if new_profile_id != filepath.stem:
+            filepath.unlink()
         print(self.theme.success(
             f"Successfully renamed profile name from"
             f" {old_profile_name} to {new_profile_name},"
@@ -272,25 +287,10 @@ class GameLauncher:
                 continue
 
             api = self.engine.run_command(self, command)
-            match api["type"]:
-                case "exit":
-                    break
-                case "help":
-                    print('\n' + api["content"] + '\n')
-                case "success":
-                    continue
-                case "failed":
-                    continue
-                case "interrupted":
-                    continue
-                case "unknown_command":
-                    print(self.theme.error(
-                        f"Unknown command: {api['command']!r}."))
-                    print(self.theme.info(
-                        f"Use 'help' for a list of commands available."))
-                case other:
-                    print(self.theme.warning(
-                        f"Unknown API response type: {other}"))
+            if api["type"] == "exit":
+                break
+            print_response(self.theme, api, _SILENT_RESPONSES,
+                           "Unknown API response type")
 
 
 def main() -> None:
@@ -2,7 +2,7 @@ from numbers import Number
 from pathlib import Path
 from typing import Any
 
-from datatype import DataType, Variable
+from datatype import DataType, Variable, with_slots
 
 from .data import Item, ItemType, SkillType
 
@@ -20,6 +20,7 @@ PROFILE_SAVE_VERSION: int = 1
 # sample player profile with common basic functionalities
 # alternatives can be modified based on this or redesigned
 # to replace the data structures
+@with_slots
 class PlayerProfile(DataType):
     variables = [
         Variable("id", str),
@@ -1,25 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from locale import getpreferredencoding
+from os import DirEntry, listdir, scandir
 from sys import version_info
 from pathlib import Path
-from re import fullmatch
+from re import compile as re_compile
 from typing import Any, Generator
 from zipfile import ZipFile, ZIP_DEFLATED
 from datetime import datetime, timezone
 
 from datatype import DataType
-from myjson import load, dump
+from myjson import loads, dump, dumps
 from str_convert import to_snake_case
 
 
 __all__ = [
-    "init_working_folder", "init_settings",
+    "init_working_folder", "init_settings", "read_json",
     "load_settings", "save_settings", "get_profiles",
-    "load_profile", "save_profile", "delete_profile", "profile_exists",
+    "load_profile", "save_profile", "save_profile_data", "delete_profile",
+    "profile_exists",
     "generate_unique_profile_id",
     "migrate_save", "migrate_saves_in_folder",
     "export_profile", "import_profile",
 ]
 
 
+_PROFILE_ID_REGEX = re_compile(r"^[a-zA-Z0-9_-]+$")
+_NUMBERED_ID_REGEX = re_compile(r"(.+)_(\d+)$")
+# smaller save folders are read faster than a thread pool starts up
+_CONCURRENT_READ_MIN: int = 32
+
+
 def _validate_profile_id(profile_id: str, /) -> None:
     """Validate that the profile ID is safe and does not allow directory traversal.
 
@@ -27,7 +38,7 @@ def _validate_profile_id(profile_id: str, /) -> None:
     """
     if not isinstance(profile_id, str):
         raise TypeError("Profile ID must be a string")
-    if not fullmatch(r"^[a-zA-Z0-9_-]+$", profile_id):
+    if not _PROFILE_ID_REGEX.fullmatch(profile_id):
         raise ValueError(
             f"Invalid profile ID: {profile_id!r}. "
             "Only alphanumeric characters, underscores, and dashes are allowed."
@@ -52,36 +63,42 @@ def init_settings(path: Path, /, override: bool = False) -> None:
     it will be reset to an empty object.
     """
     filepath = path / "settings.json"
-    if filepath.is_file():
+    try:
+        with open(filepath, "rb") as file:
+            if override:
+                _parse_json(file.read())
+    except FileNotFoundError:
+        save_settings(path, {})
+    except Exception:
         if override:
-            try:
-                with open(filepath) as file:
-                    load(file)
-            except Exception:
-                tmp_filepath = filepath.with_suffix(".tmp")
-                try:
-                    with open(tmp_filepath, "w") as file:
-                        dump({}, file)
-                    tmp_filepath.replace(filepath)
-                except Exception as e:
-                    tmp_filepath.unlink(missing_ok=True)
-                    raise e
-    else:
-        tmp_filepath = filepath.with_suffix(".tmp")
-        try:
-            with open(tmp_filepath, "w") as file:
-                dump({}, file)
-            tmp_filepath.replace(filepath)
-        except Exception as e:
-            tmp_filepath.unlink(missing_ok=True)
-            raise e
+            save_settings(path, {})
+
+
+def _parse_json(data: bytes, /) -> Any:
+    """Parse the bytes of a JSON file written by this module.
+
+    Files are written as UTF-8.  Files that are not valid UTF-8 were saved in
+    the locale encoding by earlier versions, and are decoded with it instead.
+    """
+    try:
+        return loads(data)
+    except UnicodeDecodeError:
+        return loads(data.decode(getpreferredencoding(False)))
+
+
+def read_json(path: Path, /) -> Any:
+    """Load and return parsed JSON from a settings or save file.
+
+    Raises ``OSError`` if the file cannot be read, and ``ValueError`` if it
+    is not valid JSON.
+    """
+    return _parse_json(path.read_bytes())
 
 
 def safe_load_json(path: Path, /) -> Any:
     """Attempt to load and return parsed JSON from a file, returning None on any error."""
     try:
-        with open(path) as file:
-            return load(file)
+        return read_json(path)
     except Exception:
         pass
 
@@ -91,10 +108,7 @@ def load_settings(path: Path, /) -> Any:
 
     Returns None if the file does not exist or cannot be parsed.
     """
-    filepath = (path / "settings.json")
-    if filepath.is_file():
-        return safe_load_json(filepath)
-    return None
+    return safe_load_json(path / "settings.json")
 
 
 def save_settings(path: Path, settings: dict[str, Any], /) -> None:
@@ -105,7 +119,7 @@ def save_settings(path: Path, settings: dict[str, Any], /) -> None:
     filepath = (path / "settings.json")
     tmp_filepath = filepath.with_suffix(".tmp")
     try:
-        with open(tmp_filepath, "w") as file:
+        with open(tmp_filepath, "w", encoding="utf-8") as file:
             dump(settings, file)
         tmp_filepath.replace(filepath)
     except Exception as e:
@@ -113,6 +127,31 @@ def save_settings(path: Path, settings: dict[str, Any], /) -> None:
         raise e
 
 
+def _read_profile_info(
+    entry: DirEntry[str], profile_cls: type[Any], validate: bool, /
+) -> tuple[Any, ...] | None:
+    """Read the ``get_profiles`` entry of a single save file.
+
+    Without ``validate`` only the type tag, name and id of the raw JSON are
+    checked, and the profile object itself is never built.  Returns None for
+    files that are skipped.
+    """
+    try:
+        with open(entry.path, "rb") as file:
+            obj = _parse_json(file.read())
+        if validate:
+            profile = profile_cls.loads(obj)
+            return (profile.name, profile.id, True)
+        if obj["type"] == profile_cls.datatype_id:
+            name, profile_id = obj["name"], obj["id"]
+            if isinstance(name, str) and isinstance(profile_id, str):
+                return (name, profile_id)
+    except Exception:
+        if validate:
+            return (entry.name[:-5], None, False)
+    return None
+
+
 def get_profiles(
     path: Path, profile_cls: type[Any], *, validate: bool = False
 ) -> Generator[Any, None, None]:
@@ -122,20 +161,30 @@ def get_profiles(
     True each entry is a ``(name, id, is_valid)`` tuple — valid profiles
     carry the parsed name and id, while unreadable files yield their
     filename stem, ``None``, and ``False``.
+
+    Save files are read concurrently once there are at least
+    ``_CONCURRENT_READ_MIN`` of them, and entries are yielded in directory
+    order.
     """
-    for filepath in (path / "saves").glob("*.json"):
-        if not filepath.is_file():
-            continue
-        try:
-            with open(filepath) as file:
-                profile = profile_cls.load(file)
-            if validate:
-                yield (profile.name, profile.id, True)
-            else:
-                yield (profile.name, profile.id)
-        except Exception:
-            if validate:
-                yield (filepath.stem, None, False)
+    try:
+        with scandir(path / "saves") as it:
+            entries = [entry for entry in it
+                       if entry.name.endswith(".json") and entry.is_file()]
+    except FileNotFoundError:
+        return
+    if len(entries) < _CONCURRENT_READ_MIN:
+        for entry in entries:
+            info = _read_profile_info(entry, profile_cls, validate)
+            if info is not None:
+                yield info
+        return
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        for info in executor.map(
+            _read_profile_info, entries,
+            repeat(profile_cls), repeat(validate),
+        ):
+            if info is not None:
+                yield info
 
 
 def load_profile(path: Path, profile_cls: type[Any], profile_id: str, /) -> Any:
@@ -159,11 +208,22 @@ def save_profile(path: Path, profile: Any, /) -> None:
     the profile ID is safe.
     """
     _validate_profile_id(profile.id)
-    filepath = path / "saves" / f"{profile.id}.json"
+    save_profile_data(path, profile.dumps())
+
+
+def save_profile_data(path: Path, obj: dict[str, Any], /) -> None:
+    """Write already serialized profile data to its file in the saves directory.
+
+    Behaves like ``save_profile``, but takes the JSON object directly, with
+    the filename derived from its ``"id"`` entry.
+    """
+    profile_id = obj["id"]
+    _validate_profile_id(profile_id)
+    filepath = path / "saves" / f"{profile_id}.json"
     tmp_filepath = filepath.with_suffix(".tmp")
     try:
-        with open(tmp_filepath, "w") as file:
-            profile.dump(file)
+        # serialize in memory, then write the encoded bytes in one call
+        tmp_filepath.write_bytes(dumps(obj).encode("utf-8"))
         tmp_filepath.replace(filepath)
     except Exception as e:
         tmp_filepath.unlink(missing_ok=True)
@@ -243,7 +303,7 @@ def migrate_saves_in_folder(path: Path, /) -> int:
         migrated, changed = migrate_save(obj)
         if changed:
             tmp_path = filepath.with_suffix(".tmp")
-            with open(tmp_path, "w") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 dump(migrated, f)
             tmp_path.replace(filepath)
             updated += 1
@@ -359,17 +419,23 @@ def generate_unique_profile_id(path: Path, name: str, /) -> str:
         A profile ID string guaranteed not to collide with existing saves.
     """
     base_id = to_snake_case(name)
-    saves = path / "saves"
-    if not (saves / f"{base_id}.json").exists():
+    # list the saves once instead of probing each candidate; compared
+    # casefolded, as file names are on case-insensitive file systems
+    try:
+        taken = {entry[:-5].casefold() for entry in listdir(path / "saves")
+                 if entry.endswith(".json")}
+    except FileNotFoundError:
+        taken = set()
+    if base_id.casefold() not in taken:
         return base_id
-    if (segments := fullmatch(r"(.+)_(\d+)$", base_id)):
+    if (segments := _NUMBERED_ID_REGEX.fullmatch(base_id)):
         root_id = segments.group(1)
         i = int(segments.group(2)) + 1
     else:
         root_id = base_id
         i = 1
     candidate = f"{root_id}_{i}"
-    while (saves / f"{candidate}.json").exists():
+    while candidate.casefold() in taken:
         i += 1
         candidate = f"{root_id}_{i}"
     return candidate
@@ -385,11 +451,11 @@ def main() -> None:
         id1 = generate_unique_profile_id(path, "Alice")
         print(id1)  # alice
 
-        (path / "saves" / f"{id1}.json").write_text("{}")
+        (path / "saves" / f"{id1}.json").write_text("{}", encoding="utf-8")
         id2 = generate_unique_profile_id(path, "Alice")
         print(id2)  # alice_1
 
-        (path / "saves" / f"{id2}.json").write_text("{}")
+        (path / "saves" / f"{id2}.json").write_text("{}", encoding="utf-8")
         id3 = generate_unique_profile_id(path, "Alice")
         print(id3)  # alice_2
 
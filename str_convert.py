@@ -1,4 +1,5 @@
-from re import sub
+from functools import lru_cache
+from string import ascii_lowercase, digits
 
 
 __all__ = [
@@ -10,11 +11,27 @@ __all__ = [
 ]
 
 
+_LOWER = frozenset(ascii_lowercase)
+_LOWER_OR_DIGIT = frozenset(ascii_lowercase + digits)
+_SNAKE_TR = str.maketrans({'-': '_', ' ': '_'})
+
+
+# pure, and called again with the same names from prompts and other converters
+@lru_cache(maxsize=256)
 def to_snake_case(name: str) -> str:
-    s1 = sub(r"[- ]", '_', name)
-    s2 = sub(r"([^_])([A-Z][a-z]+)", r"\1_\2", s1)
-    s3 = sub(r"([a-z0-9])([A-Z])", r"\1_\2", s2).lower()
-    return s3.lower()
+    name = name.translate(_SNAKE_TR)
+    result = []
+    prev = ''
+    for i, char in enumerate(name):
+        # split before a capital that ends a lowercase or digit run, or that
+        # starts a capitalized word
+        if 'A' <= char <= 'Z' and prev and (
+                prev in _LOWER_OR_DIGIT
+                or prev != '_' and name[i + 1:i + 2] in _LOWER):
+            result.append('_')
+        result.append(char)
+        prev = char
+    return ''.join(result).lower()
 
 
 def to_camel_case(name: str) -> str:
@@ -1,6 +1,9 @@
 """Tests for CLIEngine — command dispatch, aliases, locking, repeat."""
 import pytest
-from cliengine import CLIEngine, ArgType, register_argtype, replace_argtype, ARG_TYPES, tokenize
+from cliengine import (
+    CLIEngine, ArgType, Command, register_argtype, replace_argtype, ARG_TYPES,
+    tokenize,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -43,6 +46,12 @@ class TestTokenize:
     def test_extra_spaces(self):
         assert tokenize("  go   north  ") == ["go", "north"]
 
+    def test_adjacent_quotes_join(self):
+        assert tokenize('say a"b c"d \'e f\'"g"') == ["say", "ab cd", "e fg"]
+
+    def test_empty_quotes_dropped(self):
+        assert tokenize('say "" x') == ["say", "x"]
+
 
 # ---------------------------------------------------------------------------
 # Command dispatch
@@ -93,6 +102,122 @@ class TestCommandDispatch:
         # CLIEngine passes None for an absent optional arg
         assert results == [None]
 
+    def test_typed_arg_rejects_invalid(self):
+        eng, ctx = make_engine()
+
+        @eng.add_command("add", ["add <a:int> <b:int>"])
+        def add(ctx, a, b):
+            return {"type": "success", "value": a + b}
+
+        assert eng.run_command(ctx, "add 2 3")["value"] == 5
+        assert eng.run_command(ctx, "add 2 x")["type"] == "unknown_command"
+
+    @pytest.mark.parametrize("value", ["nan", "inf", "1e5", "1_000", "' 5'"])
+    def test_numeric_args_reject_non_pattern_values(self, value):
+        eng, ctx = make_engine()
+
+        @eng.add_command("give", ["give <amount:num>", "take <amount:int>"])
+        def give(ctx, amount):
+            return {"type": "success"}
+
+        assert eng.run_command(ctx, "give 1.5")["type"] == "success"
+        assert eng.run_command(ctx, "take 5")["type"] == "success"
+        assert eng.run_command(ctx, f"give {value}")["type"] == "unknown_command"
+        assert eng.run_command(ctx, f"take {value}")["type"] == "unknown_command"
+
+    def test_secondary_pattern_word(self):
+        eng, ctx = make_engine()
+
+        @eng.add_command("list", ["list", "ls"])
+        def list_(ctx):
+            return {"type": "success"}
+
+        assert eng.run_command(ctx, "ls")["type"] == "success"
+        assert eng.run_command(ctx, "ls -a")["type"] == "unknown_command"
+
+    def test_pattern_starting_with_var(self):
+        eng, ctx = make_engine()
+
+        @eng.add_command("echo", ["<text:str>"])
+        def echo(ctx, text):
+            return {"type": "success", "text": text}
+
+        assert eng.run_command(ctx, "anything")["text"] == "anything"
+        assert eng.run_command(ctx, "exit")["type"] == "exit"
+
+    def test_repeated_command_and_late_registration(self):
+        eng, ctx = make_engine()
+        assert eng.run_command(ctx, "wave")["type"] == "unknown_command"
+        results = []
+
+        @eng.add_command("wave", ["wave [times:int]"])
+        def wave(ctx, times):
+            results.append(times)
+            return {"type": "success"}
+
+        eng.run_command(ctx, "wave 2")
+        eng.run_command(ctx, "wave 2")
+        eng.run_command(ctx, "wave")
+        assert results == [2, 2, None]
+
+    def test_handlers_bound_by_keyword(self):
+        eng, ctx = make_engine()
+
+        @eng.add_command("sub", ["sub <a:int> <b:int>"])
+        def sub(ctx, b, a):
+            return {"type": "numerical", "value": a - b}
+
+        @eng.add_command("pair", ["pair <a> <b>"])
+        def pair(ctx, **kwargs):
+            return {"type": "success", "args": kwargs}
+
+        assert eng.run_command(ctx, "sub 5 2")["value"] == 3
+        assert eng.run_command(ctx, "pair x y")["args"] == {"a": "x", "b": "y"}
+
+    def test_overridden_call_used(self):
+        eng, ctx = make_engine()
+
+        class LoggedCommand(Command):
+            def call(self, ctx, parsed_args):
+                ctx.calls.append(parsed_args)
+                return super().call(ctx, parsed_args)
+
+        def move(ctx, d):
+            return {"type": "success"}
+
+        eng.register(LoggedCommand("move", move, ["move <d>"]))
+        eng.run_command(ctx, "move north")
+        assert ctx.calls == [{"d": "north"}]
+
+    def test_overridden_try_match_used(self):
+        eng, ctx = make_engine()
+
+        class PrefixCommand(Command):
+            def try_match(self, tokens):
+                # accept any prefix of the command name
+                if len(tokens) == 2 and self.name.startswith(tokens[0]):
+                    return {"d": tokens[1]}
+                return None
+
+        def move(ctx, d):
+            return {"type": "success", "value": d}
+
+        eng.register(PrefixCommand("move", move, ["move <d>"]))
+        assert eng.run_command(ctx, "mo north")["value"] == "north"
+        assert eng.run_command(ctx, "move south")["value"] == "south"
+        assert eng.run_command(ctx, "mo")["type"] == "unknown_command"
+
+    def test_reassigned_func_used(self):
+        eng, ctx = make_engine()
+
+        @eng.add_command("echo", ["echo <a>"])
+        def echo(ctx, a):
+            return {"type": "success", "value": a}
+
+        assert eng.run_command(ctx, "echo x")["value"] == "x"
+        eng.commands["echo"].func = lambda ctx, **kw: {"type": "kw", "value": kw}
+        assert eng.run_command(ctx, "echo x")["value"] == {"a": "x"}
+
     def test_exit_command(self):
         eng, ctx = make_engine()
         api = eng.run_command(ctx, "exit")
@@ -134,6 +259,20 @@ class TestAliases:
         eng.run_command(ctx, "atk troll")
         assert results == ["goblin", "troll"]
 
+    def test_alias_reaches_other_commands_patterns(self):
+        eng, ctx = make_engine()
+
+        @eng.add_command("get", ["get <slot:int>"], aliases=["g"])
+        def get(ctx, slot):
+            return {"type": "get"}
+
+        @eng.add_command("info", ["info", "get info"])
+        def info(ctx):
+            return {"type": "info"}
+
+        assert eng.run_command(ctx, "g 1") == {"type": "get"}
+        assert eng.run_command(ctx, "g info") == {"type": "info"}
+
     def test_duplicate_alias_raises(self):
         eng, ctx = make_engine()
 
@@ -211,6 +350,42 @@ class TestRepeat:
         assert api["type"] == "failed"
 
 
+# ---------------------------------------------------------------------------
+# Help
+# ---------------------------------------------------------------------------
+
+class TestHelp:
+    def test_help_shows_exit_help(self):
+        eng = CLIEngine(exit_help="Exit and save game.")
+        api = eng.run_command(DummyCtx(), "help exit")
+        assert api["content"].endswith("Exit and save game.")
+
+    def test_help_follows_reassigned_func(self):
+        eng, ctx = make_engine()
+
+        @eng.add_command("look", ["look"])
+        def look(ctx):
+            """Look around."""
+
+        assert eng.run_command(ctx, "help look")["content"].endswith("Look around.")
+
+        def peek(ctx):
+            """Peek around."""
+
+        eng.commands["look"].func = peek
+        assert eng.run_command(ctx, "help look")["content"].endswith("Peek around.")
+
+    def test_add_command_help_text(self):
+        eng, ctx = make_engine()
+
+        @eng.add_command("look", ["look"], help_text="Describe the room.")
+        def look(ctx):
+            """Look around."""
+
+        api = eng.run_command(ctx, "help look")
+        assert api["content"].endswith("Describe the room.")
+
+
 # ---------------------------------------------------------------------------
 # Custom ArgType registration
 # ---------------------------------------------------------------------------
@@ -218,6 +393,7 @@ class TestRepeat:
 class TestArgTypeRegistration:
     def teardown_method(self):
         ARG_TYPES.pop("compass", None)
+        ARG_TYPES.pop("item", None)
 
     def test_register_custom(self):
         at = ArgType("compass", r"north|south|east|west", lambda x: x)
@@ -230,6 +406,49 @@ class TestArgTypeRegistration:
         with pytest.raises(ValueError):
             register_argtype(at)
 
+    def test_custom_pattern_enforced(self):
+        register_argtype(ArgType("compass", r"north|south|east|west", lambda x: x))
+        eng, ctx = make_engine()
+
+        @eng.add_command("go", ["go <dir:compass>"])
+        def go(ctx, dir):
+            return {"type": "success"}
+
+        assert eng.run_command(ctx, "go north")["type"] == "success"
+        assert eng.run_command(ctx, "go up")["type"] == "unknown_command"
+
+    def test_str_rejects_newlines(self):
+        assert ARG_TYPES["str"].is_valid("a b")
+        assert not ARG_TYPES["str"].is_valid("")
+        assert not ARG_TYPES["str"].is_valid("a\nb")
+
+    def test_fast_validator_used(self):
+        at = ArgType("compass", r"north|south|east|west", lambda x: x,
+                     fast_validator={"north", "south", "east", "west"}.__contains__)
+        assert at.is_valid("east")
+        assert not at.is_valid("up")
+        with pytest.raises(ValueError):
+            at.convert("up")
+
+    def test_stateful_converter_not_cached(self):
+        room = {"lamp": 1}
+
+        def find_item(name):
+            return room[name]  # KeyError when the item is not in the room
+
+        register_argtype(ArgType("item", r".+", find_item))
+        eng, ctx = make_engine()
+
+        @eng.add_command("take", ["take <it:item>"])
+        def take(ctx, it):
+            return {"type": "success", "value": it}
+
+        assert eng.run_command(ctx, "take key")["type"] == "unknown_command"
+        room["key"] = 2
+        assert eng.run_command(ctx, "take key")["value"] == 2
+        room["key"] = 3
+        assert eng.run_command(ctx, "take key")["value"] == 3
+
     def test_replace_overwrites(self):
         at1 = ArgType("compass", r"north|south", lambda x: x)
         ARG_TYPES["compass"] = at1
@@ -245,3 +464,23 @@ class TestPatternCoverage:
         p2 = CommandPattern("cmd [x:int]")
         assert p1.is_covered_by(p2) is True
         assert p2.is_covered_by(p1) is False
+
+
+class TestParseCommand:
+    def test_word_and_typed_args(self):
+        from cliengine import parse_command
+        parts = parse_command("add <a:int> [b:num]")
+        assert [(p.kind, p.name, p.is_optional) for p in parts] == [
+            ("word", "add", False), ("var", "a", False), ("var", "b", True)]
+        assert parts[1].type is ARG_TYPES["int"]
+        assert parts[2].type is ARG_TYPES["num"]
+
+    def test_malformed_var_is_word(self):
+        from cliengine import parse_command
+        parts = parse_command("go <1x>")
+        assert [(p.kind, p.name) for p in parts] == [("word", "go"), ("word", "<1x>")]
+
+    def test_required_after_optional_raises(self):
+        from cliengine import parse_command
+        with pytest.raises(ValueError):
+            parse_command("cmd [a] <b>")
@@ -1,7 +1,9 @@
 """Tests for the DataType and Variable base classes."""
 import io
+import weakref
+from abc import ABC
 import pytest
-from datatype import DataType, Variable
+from datatype import DataType, Variable, with_slots
 
 
 class Point(DataType):
@@ -87,6 +89,105 @@ class TestDataTypeInit:
         with pytest.raises(TypeError):
             Point(x=1, y=2, unknown=99)
 
+    def test_duplicate_value_raises(self):
+        with pytest.raises(TypeError):
+            Point(1, 2, x=3)
+
+    def test_default_factory_fresh_per_instance(self):
+        class Bag(DataType):
+            variables = [Variable("items", list[int], default_factory=list)]
+
+        a, b = Bag(), Bag()
+        a.items.append(1)
+        assert b.items == []
+
+    def test_custom_init_kept(self):
+        class Custom(DataType):
+            variables = [Variable("x", int)]
+
+            def __init__(self, x: int = 7) -> None:
+                DataType.__init__(self, x)
+
+        assert Custom().x == 7
+
+    def test_subclass_override_reaches_super(self):
+        class Base(DataType):
+            variables = [Variable("x", int)]
+
+        base_methods = {name: Base.__dict__[name]
+                        for name in ("__init__", "dumps", "loads")}
+
+        class Child(Base):
+            variables = [Variable("x", int), Variable("y", int)]
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+
+            def dumps(self):
+                return super().dumps()
+
+            @classmethod
+            def loads(cls, obj):
+                return super().loads(obj)
+
+        assert {name: Base.__dict__[name] for name in base_methods} == base_methods
+        child = Child(1, 2)
+        assert (child.x, child.y) == (1, 2)
+        assert child.dumps() == {"x": 1, "y": 2, "type": "child"}
+        assert Child.loads(child.dumps()).y == 2
+        assert Base(3).x == 3
+        with pytest.raises(TypeError):
+            Base(1, 2)
+
+    def test_with_slots(self):
+        @with_slots
+        class Slotted(DataType):
+            variables = [Variable("x", int), Variable("y", int, default=0)]
+
+            def total(self):
+                return super().__repr__() and self.x + self.y
+
+        p = Slotted(1, 2)
+        assert not hasattr(p, "__dict__")
+        assert p.total() == 3
+        assert weakref.ref(p)() is p
+        with pytest.raises(AttributeError):
+            p.z = 3  # type: ignore[attr-defined]
+
+    def test_with_slots_rejects_private_name(self):
+        class Secret(DataType):
+            variables = [Variable("__secret", int)]
+
+        with pytest.raises(TypeError):
+            with_slots(Secret)
+
+    def test_plain_subclasses_keep_dict(self):
+        class Tagged(DataType, ABC):
+            variables = [Variable("x", int)]
+
+        class Other(DataType):
+            variables = [Variable("y", int)]
+
+        class Both(Tagged, Other):
+            variables = [Variable("x", int), Variable("y", int)]
+
+        both = Both(1, 2)
+        both.note = "ad hoc"
+        assert weakref.ref(both)() is both
+
+    def test_variables_extendable_by_subclass(self):
+        class Point3(Point):
+            variables = Point.variables + [Variable("z", int, default=0)]
+
+        p = Point3(1, 2, z=3)
+        assert (p.x, p.y, p.z) == (1, 2, 3)
+
+    def test_private_variable_name(self):
+        class Secret(DataType):
+            variables = [Variable("__secret", int)]
+
+        assert getattr(Secret(1), "__secret") == 1
+
 
 class TestDataTypeSerialisation:
     def test_dumps_includes_type_tag(self):
@@ -123,3 +224,16 @@ class TestDataTypeSerialisation:
     def test_loads_missing_type_tag_raises(self):
         with pytest.raises(TypeError):
             Point.loads({"x": 1, "y": 2})
+
+    def test_dumper_loader_and_dump_defaults(self):
+        class Pos(DataType):
+            DUMP_DEFAULTS = True
+            variables = [
+                Variable("at", tuple[int, int], default=(0, 0),
+                         loader=tuple, dumper=list),
+            ]
+
+        d = Pos((1, 2)).dumps()
+        assert d == {"at": [1, 2], "type": "pos"}
+        assert Pos.loads(d).at == (1, 2)
+        assert Pos().dumps() == {"at": [0, 0], "type": "pos"}
@@ -5,6 +5,8 @@ from models.data import (
 )
 from models.profile import PlayerProfile
 from models.context import GameContext
+from models.launcher import GameLauncher
+from profile_manage import init_working_folder, load_profile, save_profile
 
 
 # ---------------------------------------------------------------------------
@@ -274,3 +276,37 @@ class TestEventQueue:
         self.ctx.schedule_event(ev)
         self.ctx.update()
         assert "ev2" in fired
+
+
+# ---------------------------------------------------------------------------
+# launcher.py — profile renaming
+# ---------------------------------------------------------------------------
+
+class TestRenameProfile:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        init_working_folder(tmp_path)
+        save_profile(tmp_path, PlayerProfile(id="hero", name="Hero"))
+        self.path = tmp_path
+        self.launcher = GameLauncher(GameContext, PlayerProfile, tmp_path)
+        self.answers = []
+        monkeypatch.setattr("models.launcher.match_input",
+                            lambda *args, **kwargs: self.answers.pop(0))
+
+    def test_keep_id(self):
+        self.answers[:] = ["Champion", "hero"]
+        assert self.launcher.rename_profile("hero") == {"type": "success"}
+        obj = load_profile(self.path, PlayerProfile, "hero")
+        assert (obj["name"], obj["id"]) == ("Champion", "hero")
+
+    def test_change_id(self):
+        self.answers[:] = ["Champion", ""]
+        assert self.launcher.rename_profile("hero") == {"type": "success"}
+        assert not (self.path / "saves" / "hero.json").exists()
+        obj = load_profile(self.path, PlayerProfile, "champion")
+        assert (obj["name"], obj["id"]) == ("Champion", "champion")
+
+    def test_corrupt_source(self):
+        (self.path / "saves" / "hero.json").write_text("{not json")
+        assert self.launcher.rename_profile("hero") == {"type": "failed"}
+        assert (self.path / "saves" / "hero.json").read_text() == "{not json"
@@ -3,8 +3,10 @@ import json
 import pytest
 from pathlib import Path
 from profile_manage import (
-    init_working_folder, get_profiles, load_profile, save_profile,
-    delete_profile, profile_exists,
+    init_working_folder, init_settings, load_settings, save_settings,
+    get_profiles,
+    load_profile, save_profile, save_profile_data,
+    delete_profile, profile_exists, generate_unique_profile_id,
     migrate_save, migrate_saves_in_folder,
     export_profile, import_profile,
 )
@@ -25,6 +27,26 @@ class TestInitWorkingFolder:
         assert (tmp_path / "settings.json").is_file()
 
 
+class TestSettings:
+    def test_load_missing_returns_none(self, tmp_path):
+        assert load_settings(tmp_path) is None
+
+    def test_init_keeps_corrupt_without_override(self, tmp_path):
+        (tmp_path / "settings.json").write_text("{bad")
+        init_settings(tmp_path)
+        assert load_settings(tmp_path) is None
+
+    def test_init_override_resets_corrupt(self, tmp_path):
+        (tmp_path / "settings.json").write_text("{bad")
+        init_settings(tmp_path, override=True)
+        assert load_settings(tmp_path) == {}
+
+    def test_saved_as_utf8(self, tmp_path):
+        save_settings(tmp_path, {"last_profile_id": "zo\u00eb"})
+        raw = (tmp_path / "settings.json").read_bytes()
+        assert json.loads(raw.decode("utf-8")) == {"last_profile_id": "zo\u00eb"}
+
+
 class TestSaveLoadDelete:
     def test_save_creates_file(self, workdir):
         p = PlayerProfile(id="hero", name="Hero")
@@ -38,6 +60,12 @@ class TestSaveLoadDelete:
         assert isinstance(raw, dict)
         assert raw["id"] == "hero"
 
+    def test_save_profile_data_keeps_raw_object(self, workdir):
+        obj = PlayerProfile(id="hero", name="Hero").dumps()
+        obj["extra"] = 1
+        save_profile_data(workdir, obj)
+        assert load_profile(workdir, PlayerProfile, "hero") == obj
+
     def test_profile_exists(self, workdir):
         p = PlayerProfile(id="hero", name="Hero")
         assert not profile_exists(workdir, "hero")
@@ -50,12 +78,48 @@ class TestSaveLoadDelete:
         ids = {pid for _, pid in get_profiles(workdir, PlayerProfile)}
         assert ids == {"a", "b"}
 
+    def test_get_profiles_concurrent(self, workdir, monkeypatch):
+        monkeypatch.setattr("profile_manage._CONCURRENT_READ_MIN", 1)
+        save_profile(workdir, PlayerProfile(id="a", name="A"))
+        save_profile(workdir, PlayerProfile(id="b", name="B"))
+        ids = {pid for _, pid in get_profiles(workdir, PlayerProfile)}
+        assert ids == {"a", "b"}
+
+    def test_get_profiles_skips_unreadable(self, workdir):
+        save_profile(workdir, PlayerProfile(id="a", name="A"))
+        (workdir / "saves" / "broken.json").write_text("{not json")
+        assert list(get_profiles(workdir, PlayerProfile)) == [("A", "a")]
+        entries = set(get_profiles(workdir, PlayerProfile, validate=True))
+        assert entries == {("A", "a", True), ("broken", None, False)}
+
+    def test_legacy_locale_encoded_save(self, workdir, monkeypatch):
+        monkeypatch.setattr("profile_manage.getpreferredencoding",
+                            lambda do_setlocale=True: "cp1252")
+        raw = json.dumps({"type": "player_profile", "id": "zoe",
+                          "name": "Zo\u00eb"}, ensure_ascii=False)
+        (workdir / "saves" / "zoe.json").write_bytes(raw.encode("cp1252"))
+        assert load_profile(workdir, PlayerProfile, "zoe")["name"] == "Zo\u00eb"
+        assert list(get_profiles(workdir, PlayerProfile)) == [("Zo\u00eb", "zoe")]
+
     def test_delete_profile(self, workdir):
         save_profile(workdir, PlayerProfile(id="hero", name="Hero"))
         delete_profile(workdir, "hero")
         assert not profile_exists(workdir, "hero")
 
 
+class TestUniqueProfileId:
+    def test_free_name_used_as_is(self, workdir):
+        assert generate_unique_profile_id(workdir, "New Hero") == "new_hero"
+
+    def test_suffix_skips_taken_ids(self, workdir):
+        for pid in ("hero", "hero_1", "hero_2"):
+            save_profile(workdir, PlayerProfile(id=pid, name="Hero"))
+        assert generate_unique_profile_id(workdir, "Hero") == "hero_3"
+
+    def test_missing_saves_dir(self, tmp_path):
+        assert generate_unique_profile_id(tmp_path, "Hero") == "hero"
+
+
 class TestMigration:
     def test_migrate_version0_to_1(self):
         obj = {"type": "player_profile", "id": "x", "name": "X"}
@@ -29,6 +29,11 @@ class TestToSnakeCase:
     def test_mixed(self):
         assert to_snake_case("some mixed_string") == "some_mixed_string"
 
+    def test_digits_and_underscored_capitals(self):
+        assert to_snake_case("level2Boss") == "level2_boss"
+        assert to_snake_case("save_FileName") == "save_file_name"
+        assert to_snake_case("getHTTP") == "get_http"
+
 
 class TestToCamelCase:
     def test_from_snake(self):
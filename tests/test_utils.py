@@ -1,6 +1,7 @@
 """Tests for utils module."""
+import io
 import pytest
-from utils import istype
+from utils import istype, match_input, read_line
 
 
 class TestIstype:
@@ -40,3 +41,37 @@ class TestIstype:
     def test_nested_generic(self):
         assert istype([[1, 2], [3]], list[list[int]])
         assert not istype([[1, "x"]], list[list[int]])
+
+    def test_tuple_generic(self):
+        assert istype((1, 2), tuple[int, ...])
+        assert istype((1, "x"), tuple[int, str])
+        assert not istype((1,), tuple[int, str])
+
+    def test_any_item_types(self):
+        from typing import Any
+        assert istype([1, "a"], list[Any])
+        assert istype({1, "a"}, set[Any])
+        assert istype((1, "a"), tuple[Any, ...])
+        assert istype({1: 2}, dict[Any, int])
+        assert not istype({1: "a"}, dict[Any, int])
+
+    def test_malformed_type_raises_when_checked(self):
+        assert not istype([], tuple[int, ..., str])
+        with pytest.raises(ValueError):
+            istype((1,), tuple[int, ..., str])
+        with pytest.raises(TypeError):
+            istype(1, 5)
+
+
+class TestReadLine:
+    def test_piped_lines(self, monkeypatch, capsys):
+        monkeypatch.setattr("sys.stdin", io.StringIO("first\nsecond\n"))
+        assert read_line("> ") == "first"
+        assert read_line() == "second"
+        assert capsys.readouterr().out == "> "
+        with pytest.raises(EOFError):
+            read_line()
+
+    def test_match_input_retries_piped(self, monkeypatch):
+        monkeypatch.setattr("sys.stdin", io.StringIO("abc\n42\n"))
+        assert match_input(r"\d+") == "42"
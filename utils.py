@@ -1,10 +1,16 @@
-from re import fullmatch
+import sys
+from collections.abc import Iterable
+from functools import lru_cache, wraps
+from re import compile as re_compile
 from types import GenericAlias, UnionType
 from typing import Any, Callable, ParamSpec, TypeVar, cast, get_args
 
 _P = ParamSpec("_P")
 _T = TypeVar("_T")
 
+# input patterns are few and reused across prompts
+_compile_pattern = lru_cache(maxsize=64)(re_compile)
+
 
 __all__ = [
     "catch_interrupt",
@@ -12,35 +18,35 @@ __all__ = [
     "catch_interrupt_silent",
     "TypeLike",
     "istype",
+    "read_line",
     "match_input",
 ]
 
 
 def catch_interrupt(func: Callable[_P, _T]) -> Callable[_P, _T | None]:
+    @wraps(func)
     def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T | None:
         try:
             return func(*args, **kwargs)
         except (EOFError, KeyboardInterrupt):
             print("\nProcess interrupted.")
             return None
-    wrapper.__doc__ = func.__doc__
-    wrapper.__annotations__ = func.__annotations__
     return wrapper
 
 
 def catch_interrupt_with_api(func: Callable[_P, Any]) -> Callable[_P, Any]:
+    @wraps(func)
     def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Any:
         try:
             return func(*args, **kwargs)
         except (EOFError, KeyboardInterrupt):
             print("\nProcess interrupted.")
             return {"type": "interrupted"}
-    wrapper.__doc__ = func.__doc__
-    wrapper.__annotations__ = func.__annotations__
     return wrapper
 
 
 def catch_interrupt_silent(func: Callable[_P, _T]) -> Callable[_P, _T | None]:
+    @wraps(func)
     def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T | None:
         try:
             return func(*args, **kwargs)
@@ -56,68 +62,217 @@ type TypeLike = (
 )
 
 
-def istype(obj: object, type_: TypeLike, /) -> bool:
+def _always_true(obj: object, /) -> bool:
+    return True
+
+
+def _is_none(obj: object, /) -> bool:
+    return obj is None
+
+
+def _is_plain_class(type_: TypeLike, /) -> bool:
+    # typing.Any is a class too, but cannot be used with isinstance
+    return isinstance(type_, type) and type_ is not Any
+
+
+def _raising(origin: type | None, error: type[Exception], message: str,
+             /) -> Callable[[object], bool]:
+    """Returns a checker that raises once a value is actually checked.
+
+    Args:
+        origin (type | None): If given, values not of this class are simply
+            rejected, and only instances of it raise.
+        error (type[Exception]): The exception class to raise.
+        message (str): The exception message.
+
+    Returns:
+        Callable[[object], bool]: The checker.
+    """
+    def check(obj: object, /) -> bool:
+        if origin is not None and not isinstance(obj, origin):
+            return False
+        raise error(message)
+    return check
+
+
+def _build_checker(type_: TypeLike, /) -> Callable[[object], bool]:
+    """Analyzes a type once and returns a checker specialized to it.
+
+    The checker behaves like ``istype(obj, type_)``, raising the same errors
+    for malformed types, and does so only when it is called.
+
+    Args:
+        type_ (TypeLike): The type to build a checker for.
+
+    Returns:
+        Callable[[object], bool]: The checker.
+    """
     if type_ is any or type_ is Any:
-        return True
+        return _always_true
     elif type_ is None:
-        return obj is None
+        return _is_none
     elif isinstance(type_, type):
-        return isinstance(obj, type_)
-    elif isinstance(type_, tuple):
-        return any(istype(obj, subtype) for subtype in type_)
-    elif isinstance(type_, UnionType):
-        return any(istype(obj, subtype) for subtype in get_args(type_))
-    elif isinstance(type_, GenericAlias):
-        if not isinstance(obj, type_.__origin__):  # type: ignore[arg-type]
+        cls = type_
+        return lambda obj: isinstance(obj, cls)
+    elif isinstance(type_, (tuple, UnionType)):
+        checkers = tuple(_get_checker(subtype) for subtype in (
+            type_ if isinstance(type_, tuple) else get_args(type_)))
+
+        def check_any(obj: object, /) -> bool:
+            for check in checkers:
+                if check(obj):
+                    return True
             return False
+        return check_any
+    elif isinstance(type_, GenericAlias):
+        origin = cast(type, type_.__origin__)
         args = get_args(type_)
-        if type_.__origin__ is tuple:
-            obj_tuple = cast("tuple[Any, ...]", obj)
-            if any(type_arg is Ellipsis for i, type_arg in enumerate(args) if i != 1):
-                raise ValueError("\"...\" is allowed only as the"
-                                 " second of two arguments")
-            elif Ellipsis in args and len(args) != 2:
-                raise ValueError("\"...\" is allowed only as the"
-                                 " second of two arguments")
+        if origin is tuple:
+            if (any(type_arg is Ellipsis for i, type_arg in enumerate(args) if i != 1)
+                    or Ellipsis in args and len(args) != 2):
+                return _raising(tuple, ValueError, "\"...\" is allowed only as"
+                                " the second of two arguments")
             if len(args) == 1 and args[0] == ():
-                return obj_tuple == ()
-            if len(args) == 2:
-                if args[1] is Ellipsis:
-                    return all(istype(item, args[0]) for item in obj_tuple)
-            return len(obj_tuple) == len(args) and all(
-                istype(item, subtype)
-                for item, subtype in zip(obj_tuple, args)
-            )
-        elif type_.__origin__ is list:
-            return all(istype(item, args[0])
-                       for item in cast("list[Any]", obj))
-        elif type_.__origin__ is set:
-            return all(istype(item, args[0])
-                       for item in cast("set[Any]", obj))
-        elif type_.__origin__ is dict:
-            return all(istype(key, args[0]) and istype(value, args[1])
-                       for key, value in cast("dict[Any, Any]", obj).items())
+                return lambda obj: isinstance(obj, tuple) and obj == ()
+            if len(args) != 2 or args[1] is not Ellipsis:
+                checkers = tuple(_get_checker(subtype) for subtype in args)
+
+                def check_fields(obj: object, /) -> bool:
+                    if not isinstance(obj, tuple) or len(obj) != len(checkers):
+                        return False
+                    for check, item in zip(checkers, obj):
+                        if not check(item):
+                            return False
+                    return True
+                return check_fields
+        # homogeneous tuples, lists and sets
+        if origin is tuple or origin is list or origin is set:
+            if _is_plain_class(args[0]):
+                item_cls = args[0]
+
+                # plain item classes are checked inline, saving a call per item
+                def check_plain_items(obj: object, /) -> bool:
+                    if not isinstance(obj, origin):
+                        return False
+                    for item in cast("Iterable[Any]", obj):
+                        if not isinstance(item, item_cls):
+                            return False
+                    return True
+                return check_plain_items
+            check_item = _get_checker(args[0])
+
+            def check_items(obj: object, /) -> bool:
+                if not isinstance(obj, origin):
+                    return False
+                for item in cast("Iterable[Any]", obj):
+                    if not check_item(item):
+                        return False
+                return True
+            return check_items
+        elif origin is dict:
+            if _is_plain_class(args[0]):
+                key_cls = args[0]
+                if args[1] is any or args[1] is Any:
+                    def check_plain_keys(obj: object, /) -> bool:
+                        if not isinstance(obj, dict):
+                            return False
+                        for key in obj:
+                            if not isinstance(key, key_cls):
+                                return False
+                        return True
+                    return check_plain_keys
+                elif _is_plain_class(args[1]):
+                    value_cls = args[1]
+
+                    def check_plain_entries(obj: object, /) -> bool:
+                        if not isinstance(obj, dict):
+                            return False
+                        for key, value in obj.items():
+                            if (not isinstance(key, key_cls)
+                                    or not isinstance(value, value_cls)):
+                                return False
+                        return True
+                    return check_plain_entries
+            check_key = _get_checker(args[0])
+            check_value = _get_checker(args[1])
+
+            def check_entries(obj: object, /) -> bool:
+                if not isinstance(obj, dict):
+                    return False
+                for key, value in obj.items():
+                    if not check_key(key) or not check_value(value):
+                        return False
+                return True
+            return check_entries
         else:
-            raise TypeError(
-                f"unrecognized generic alias origin:"
-                f" {type_.__origin__.__name__}"
-            )
+            return _raising(origin, TypeError,
+                            f"unrecognized generic alias origin:"
+                            f" {origin.__name__}")
     else:
-        raise TypeError(
-            f"istype() arg 2 must be a type_, a tuple of types,"
-            f" a union, or a generic alias, not {type(type_).__name__}"
-        )
-
-
-@catch_interrupt
-def match_input(pattern: str, /, strip: bool = False) -> str:
-    while True:
-        string = input(":> ")
-        if strip:
-            string = string.strip()
-        if fullmatch(pattern, string):
-            return string
-        print("Invalid format, try again.")
+        return _raising(None, TypeError,
+                        f"istype() arg 2 must be a type_, a tuple of types,"
+                        f" a union, or a generic alias, not {type(type_).__name__}")
+
+
+_compile_checker = lru_cache(maxsize=1024)(_build_checker)
+
+
+def _get_checker(type_: TypeLike, /) -> Callable[[object], bool]:
+    """Returns the cached checker for a type, building one if it is unhashable."""
+    try:
+        return _compile_checker(type_)
+    except TypeError:
+        return _build_checker(type_)
+
+
+def istype(obj: object, type_: TypeLike, /) -> bool:
+    if type(type_) is type:
+        # plain classes, the most common case, need no checker
+        return isinstance(obj, type_)
+    return _get_checker(type_)(obj)
+
+
+def read_line(prompt: str = "", /) -> str:
+    """Reads a line from stdin like ``input``, without its overhead when piped.
+
+    Interactive terminals keep using ``input`` and its line editing, while
+    piped or redirected stdin is read with ``sys.stdin.readline`` directly.
+
+    Args:
+        prompt (str): The prompt written before reading.
+
+    Returns:
+        str: The line read, without its trailing newline.
+
+    Raises:
+        EOFError: If stdin is at end of file.
+    """
+    stdin = sys.stdin
+    if stdin is None or stdin.isatty():
+        return input(prompt)
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = stdin.readline()
+    if not line:
+        raise EOFError
+    return line.removesuffix("\n")
+
+
+def match_input(pattern: str, /, strip: bool = False) -> str | None:
+    # handles interrupts like catch_interrupt, without the wrapper frame
+    regex = _compile_pattern(pattern)
+    try:
+        while True:
+            string = read_line(":> ")
+            if strip:
+                string = string.strip()
+            if regex.fullmatch(string):
+                return string
+            print("Invalid format, try again.")
+    except (EOFError, KeyboardInterrupt):
+        print("\nProcess interrupted.")
+        return None
 
 
 def main() -> None: